@@ -135,6 +135,15 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Argon2id first (needs argon2-cffi); PBKDF2 and friends stay to verify older hashes
+PASSWORD_HASHERS = [
+    'users.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -164,7 +173,7 @@ AUTH_USER_MODEL = 'users.User'
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -213,7 +222,8 @@ LOGGING = {
     'loggers': {
         'users': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            # Per-request view logs are debug records; set USERS_LOG_LEVEL=DEBUG to see them
+            'level': os.getenv('USERS_LOG_LEVEL', 'INFO'),
             'propagate': False,
         },
     },
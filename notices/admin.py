@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Notice
+from .models import Notice, Category
 
 
 @admin.register(Notice)
@@ -7,8 +7,10 @@ class NoticeAdmin(admin.ModelAdmin):
     """Admin interface for Notice model"""
     list_display = ('category', 'title', 'audience', 'priority', 'posted_by', 'created_at')
     list_filter = ('category', 'audience', 'priority', 'created_at')
-    search_fields = ('title', 'content', 'category', 'posted_by__email', 'posted_by__first_name')
+    # category holds short codes; get_search_results matches it by label instead
+    search_fields = ('title', 'content', 'posted_by__email', 'posted_by__first_name')
     ordering = ('-created_at',)
+    list_select_related = ('posted_by',)
     readonly_fields = ('created_at', 'updated_at')
     
     fieldsets = (
@@ -25,3 +27,15 @@ class NoticeAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'updated_at')
         }),
     )
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('posted_by')
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        term = search_term.strip().lower()
+        codes = [code for code, label in Category.choices if term and term in label.lower()]
+        if codes:
+            # Filter the incoming queryset so list_filter selections still apply
+            results |= queryset.filter(category__in=codes)
+        return results, may_have_duplicates
@@ -3,6 +3,10 @@ from django.utils import timezone
 from datetime import timedelta
 from notices.models import Notice
 
+# Rows removed per DELETE statement, keeps each statement's locks short
+BATCH_SIZE = 5000
+
+
 class Command(BaseCommand):
     help = "Auto delete notices after 5 minutes"
 
@@ -10,10 +14,18 @@ class Command(BaseCommand):
         now = timezone.now()
         five_minutes_ago = now - timedelta(minutes=5)
 
-        deleted = Notice.objects.filter(
-            created_at__lt=five_minutes_ago
-        ).delete()
+        expired = Notice.objects.filter(created_at__lt=five_minutes_ago)
+
+        # Nothing references Notice, so the deletion collector and signals
+        # can be skipped and each batch issued as a single DELETE.
+        deleted = 0
+        while True:
+            ids = list(expired.values_list('pk', flat=True)[:BATCH_SIZE])
+            if not ids:
+                break
+            batch = Notice.objects.filter(pk__in=ids)
+            deleted += batch._raw_delete(batch.db)
 
         self.stdout.write(self.style.SUCCESS(
-            f"Auto delete completed. Deleted notices: {deleted[0]}"
+            f"Auto delete completed. Deleted notices: {deleted}"
         ))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-14 12:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notices', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['audience', '-created_at'], name='notice_aud_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['created_at'], name='notice_created_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-14 12:20
+
+from django.db import migrations, models
+
+LABEL_TO_CODE = {
+    'Staff Meeting': 'STFMTG',
+    'Invigilation Duty': 'INVGDUTY',
+    'Internal Circular': 'INTCIRC',
+    'Timetable Work': 'TTWORK',
+    'Leave / Policy Update': 'LVPOLICY',
+    'Faculty Training': 'FACTRAIN',
+    'Research Opportunities': 'RESEARCH',
+    'Staff Achievements': 'STFACHV',
+    'Maintenance Notices': 'MAINT',
+    'IT & System Updates': 'ITSYS',
+    'Holiday Announcement': 'HOLIDAY',
+    'Exam Timetable': 'EXAMTT',
+    'Events': 'EVENTS',
+    'Results': 'RESULTS',
+    'Fee Notices': 'FEES',
+    'Emergency Alerts': 'EMERG',
+    'Workshops / Seminars': 'WORKSHOP',
+    'Scholarship / Grants': 'SCHOLAR',
+    'Campus News': 'NEWS',
+    'Sports / Cultural Updates': 'SPORTS',
+}
+
+
+def labels_to_codes(apps, schema_editor):
+    Notice = apps.get_model('notices', 'Notice')
+    for label, code in LABEL_TO_CODE.items():
+        Notice.objects.filter(category=label).update(category=code)
+
+
+def codes_to_labels(apps, schema_editor):
+    Notice = apps.get_model('notices', 'Notice')
+    for label, code in LABEL_TO_CODE.items():
+        Notice.objects.filter(category=code).update(category=label)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notices', '0002_notice_indexes'),
+    ]
+
+    operations = [
+        # Convert while the column is still wide enough for the old labels
+        migrations.RunPython(labels_to_codes, codes_to_labels),
+        migrations.AlterField(
+            model_name='notice',
+            name='category',
+            field=models.CharField(choices=[('STFMTG', 'Staff Meeting'), ('INVGDUTY', 'Invigilation Duty'), ('INTCIRC', 'Internal Circular'), ('TTWORK', 'Timetable Work'), ('LVPOLICY', 'Leave / Policy Update'), ('FACTRAIN', 'Faculty Training'), ('RESEARCH', 'Research Opportunities'), ('STFACHV', 'Staff Achievements'), ('MAINT', 'Maintenance Notices'), ('ITSYS', 'IT & System Updates'), ('HOLIDAY', 'Holiday Announcement'), ('EXAMTT', 'Exam Timetable'), ('EVENTS', 'Events'), ('RESULTS', 'Results'), ('FEES', 'Fee Notices'), ('EMERG', 'Emergency Alerts'), ('WORKSHOP', 'Workshops / Seminars'), ('SCHOLAR', 'Scholarship / Grants'), ('NEWS', 'Campus News'), ('SPORTS', 'Sports / Cultural Updates')], max_length=8),
+        ),
+    ]
@@ -3,35 +3,57 @@ from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+
+class Category(models.TextChoices):
+    """Notice categories, stored as short codes and shown by their label"""
+    # Staff Categories
+    STAFF_MEETING = 'STFMTG', 'Staff Meeting'
+    INVIGILATION_DUTY = 'INVGDUTY', 'Invigilation Duty'
+    INTERNAL_CIRCULAR = 'INTCIRC', 'Internal Circular'
+    TIMETABLE_WORK = 'TTWORK', 'Timetable Work'
+    LEAVE_POLICY_UPDATE = 'LVPOLICY', 'Leave / Policy Update'
+    FACULTY_TRAINING = 'FACTRAIN', 'Faculty Training'
+    RESEARCH_OPPORTUNITIES = 'RESEARCH', 'Research Opportunities'
+    STAFF_ACHIEVEMENTS = 'STFACHV', 'Staff Achievements'
+    MAINTENANCE_NOTICES = 'MAINT', 'Maintenance Notices'
+    IT_SYSTEM_UPDATES = 'ITSYS', 'IT & System Updates'
+
+    # All Users Categories
+    HOLIDAY_ANNOUNCEMENT = 'HOLIDAY', 'Holiday Announcement'
+    EXAM_TIMETABLE = 'EXAMTT', 'Exam Timetable'
+    EVENTS = 'EVENTS', 'Events'
+    RESULTS = 'RESULTS', 'Results'
+    FEE_NOTICES = 'FEES', 'Fee Notices'
+    EMERGENCY_ALERTS = 'EMERG', 'Emergency Alerts'
+    WORKSHOPS_SEMINARS = 'WORKSHOP', 'Workshops / Seminars'
+    SCHOLARSHIP_GRANTS = 'SCHOLAR', 'Scholarship / Grants'
+    CAMPUS_NEWS = 'NEWS', 'Campus News'
+    SPORTS_CULTURAL_UPDATES = 'SPORTS', 'Sports / Cultural Updates'
+
+
+# Categories that are only relevant to staff
+STAFF_CATEGORIES = frozenset({
+    Category.STAFF_MEETING, Category.INVIGILATION_DUTY, Category.INTERNAL_CIRCULAR,
+    Category.TIMETABLE_WORK, Category.LEAVE_POLICY_UPDATE, Category.FACULTY_TRAINING,
+    Category.RESEARCH_OPPORTUNITIES, Category.STAFF_ACHIEVEMENTS,
+    Category.MAINTENANCE_NOTICES, Category.IT_SYSTEM_UPDATES,
+})
+
+# Categories that are visible to all users
+ALL_USERS_CATEGORIES = frozenset(Category) - STAFF_CATEGORIES
+
+# Default audience for each category
+CATEGORY_AUDIENCE = {
+    **dict.fromkeys(STAFF_CATEGORIES, 'staff'),
+    **dict.fromkeys(ALL_USERS_CATEGORIES, 'all'),
+}
+
+
 class Notice(models.Model):
 
     # ---------------- CATEGORY ----------------
-    CATEGORY_CHOICES = [
-        # Staff Categories
-        ('Staff Meeting', 'Staff Meeting'),
-        ('Invigilation Duty', 'Invigilation Duty'),
-        ('Internal Circular', 'Internal Circular'),
-        ('Timetable Work', 'Timetable Work'),
-        ('Leave / Policy Update', 'Leave / Policy Update'),
-        ('Faculty Training', 'Faculty Training'),
-        ('Research Opportunities', 'Research Opportunities'),
-        ('Staff Achievements', 'Staff Achievements'),
-        ('Maintenance Notices', 'Maintenance Notices'),
-        ('IT & System Updates', 'IT & System Updates'),
-
-        # All Users Categories
-        ('Holiday Announcement', 'Holiday Announcement'),
-        ('Exam Timetable', 'Exam Timetable'),
-        ('Events', 'Events'),
-        ('Results', 'Results'),
-        ('Fee Notices', 'Fee Notices'),
-        ('Emergency Alerts', 'Emergency Alerts'),
-        ('Workshops / Seminars', 'Workshops / Seminars'),
-        ('Scholarship / Grants', 'Scholarship / Grants'),
-        ('Campus News', 'Campus News'),
-        ('Sports / Cultural Updates', 'Sports / Cultural Updates'),
-    ]
-    category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
+    CATEGORY_CHOICES = Category.choices
+    category = models.CharField(max_length=8, choices=CATEGORY_CHOICES)
 
     # ---------------- AUDIENCE ----------------
     AUDIENCE_CHOICES = [
@@ -58,26 +80,20 @@ class Notice(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def save(self, *args, **kwargs):
-        # Automatically set audience based on category if not manually set
-        staff_categories = [
-            'Staff Meeting', 'Invigilation Duty', 'Internal Circular', 'Timetable Work',
-            'Leave / Policy Update', 'Faculty Training', 'Research Opportunities',
-            'Staff Achievements', 'Maintenance Notices', 'IT & System Updates'
-        ]
-        all_users_categories = [
-            'Holiday Announcement', 'Exam Timetable', 'Events', 'Results', 'Fee Notices',
-            'Emergency Alerts', 'Workshops / Seminars', 'Scholarship / Grants',
-            'Campus News', 'Sports / Cultural Updates'
+    class Meta:
+        indexes = [
+            # Serves the audience filter + newest-first ordering of the list endpoint
+            models.Index(fields=['audience', '-created_at'], name='notice_aud_created_idx'),
+            # Serves the created_at range scan in delete_old_notices
+            models.Index(fields=['created_at'], name='notice_created_idx'),
         ]
 
+    def save(self, *args, **kwargs):
+        # Automatically set audience based on category if not manually set
         if not self.audience:
-            if self.category in staff_categories:
-                self.audience = 'staff'
-            elif self.category in all_users_categories:
-                self.audience = 'all'
+            self.audience = CATEGORY_AUDIENCE.get(self.category, self.audience)
 
         super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"{self.category} - {self.title or 'No Title'}"
+        return f"{self.get_category_display()} - {self.title or 'No Title'}"
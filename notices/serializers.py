@@ -1,10 +1,52 @@
 from rest_framework import serializers
-from .models import Notice
+from .models import Notice, Category, CATEGORY_AUDIENCE
+
+# Lets clients keep sending the category label instead of its stored code
+_CATEGORY_BY_LABEL = {label: code for code, label in Category.choices}
+
+
+class BlankAsNullMixin:
+    """Treat a blank string as null, for optional fields cleared with ''"""
+    
+    def run_validation(self, data=serializers.empty):
+        if isinstance(data, str) and not data.strip():
+            data = None
+        return super().run_validation(data)
+
+
+class BlankAsNullCharField(BlankAsNullMixin, serializers.CharField):
+    pass
+
+
+class BlankAsNullDateField(BlankAsNullMixin, serializers.DateField):
+    pass
+
+
+class BlankAsNullDateTimeField(BlankAsNullMixin, serializers.DateTimeField):
+    pass
+
+
+class CategoryField(serializers.ChoiceField):
+    """Accepts a category code or label and renders the label"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(choices=Category.choices, **kwargs)
+    
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = _CATEGORY_BY_LABEL.get(data, data)
+        return super().to_internal_value(data)
+    
+    def to_representation(self, value):
+        return self.choices.get(value, value)
 
 
 class NoticeSerializer(serializers.ModelSerializer):
     """Serializer for Notice model"""
-    posted_by_name = serializers.SerializerMethodField()
+    category = CategoryField()
+    posted_by_name = serializers.CharField(
+        source='posted_by.get_full_name', read_only=True, default=None
+    )
     
     class Meta:
         model = Notice
@@ -14,29 +56,25 @@ class NoticeSerializer(serializers.ModelSerializer):
             'posted_by', 'posted_by_name', 'created_at', 'updated_at'
         )
         read_only_fields = ('id', 'posted_by', 'created_at', 'updated_at')
-    
-    def get_posted_by_name(self, obj):
-        if obj.posted_by:
-            return obj.posted_by.get_full_name()
-        return None
 
 
-class NoticeCreateSerializer(serializers.ModelSerializer):
-    """Serializer for creating a notice"""
+class NoticeCreateSerializer(NoticeSerializer):
+    """
+    Serializer for creating a notice.
+    Shares NoticeSerializer's fields so the saved notice can be returned
+    from serializer.data without serializing it a second time.
+    """
+    # Optional fields accept '' and store it as None
+    title = BlankAsNullCharField(required=False, allow_null=True, max_length=200)
+    content = BlankAsNullCharField(required=False, allow_null=True)
+    date = BlankAsNullDateField(required=False, allow_null=True)
+    datetime = BlankAsNullDateTimeField(required=False, allow_null=True)
+    expiry_date = BlankAsNullDateTimeField(required=False, allow_null=True)
     
-    class Meta:
-        model = Notice
-        fields = (
-            'category', 'audience', 'title', 'content',
-            'date', 'datetime', 'priority', 'expiry_date'
-        )
+    class Meta(NoticeSerializer.Meta):
+        pass
     
     def validate(self, attrs):
-        # Convert empty strings to None for optional fields
-        for field in ['title', 'content', 'date', 'datetime', 'expiry_date']:
-            if field in attrs and attrs[field] == '':
-                attrs[field] = None
-        
         # Validate that at least title or content is provided
         if not attrs.get('title') and not attrs.get('content'):
             raise serializers.ValidationError(
@@ -48,24 +86,9 @@ class NoticeCreateSerializer(serializers.ModelSerializer):
         category = attrs.get('category')
         audience = attrs.get('audience')
         
-        if category:
-            staff_categories = [
-                'Staff Meeting', 'Invigilation Duty', 'Internal Circular', 'Timetable Work',
-                'Leave / Policy Update', 'Faculty Training', 'Research Opportunities',
-                'Staff Achievements', 'Maintenance Notices', 'IT & System Updates'
-            ]
-            all_users_categories = [
-                'Holiday Announcement', 'Exam Timetable', 'Events', 'Results', 'Fee Notices',
-                'Emergency Alerts', 'Workshops / Seminars', 'Scholarship / Grants',
-                'Campus News', 'Sports / Cultural Updates'
-            ]
-            
-            # Auto-set audience if not provided
-            if not audience:
-                if category in staff_categories:
-                    attrs['audience'] = 'staff'
-                elif category in all_users_categories:
-                    attrs['audience'] = 'all'
+        # Auto-set audience if not provided
+        if category and not audience:
+            attrs['audience'] = CATEGORY_AUDIENCE[category]
         
         return attrs
     
@@ -1,3 +1,58 @@
-from django.test import TestCase
+from django.contrib.admin.sites import site
+from django.test import RequestFactory
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from users.models import User, Role
+from .models import Notice
+
+
+def make_user(email, role):
+    return User.objects.create_user(
+        email=email, password='pass12345', first_name='Test', last_name='User', role=role
+    )
+
+
+class NoticePermissionTests(APITestCase):
+    """Notice writes are limited by role through IsAdmin/IsAdminOrStaff"""
+
+    def setUp(self):
+        self.student = make_user('student@example.com', Role.STUDENT)
+        self.staff = make_user('staff@example.com', Role.STAFF)
+        self.notice = Notice.objects.create(category='EVENTS', title='Fest', posted_by=self.staff)
+
+    def create(self):
+        return self.client.post(
+            '/api/notices/create/', {'category': 'EVENTS', 'audience': 'all', 'title': 'Sports day'}, format='json'
+        )
+
+    def test_student_cannot_write(self):
+        self.client.force_authenticate(self.student)
+        self.assertEqual(self.create().status_code, 403)
+        self.assertEqual(self.client.get('/api/notices/export/').status_code, 403)
+        self.assertEqual(self.client.delete(f'/api/notices/manage/{self.notice.id}/').status_code, 403)
+        self.assertTrue(Notice.objects.filter(pk=self.notice.pk).exists())
+
+    def test_staff_can_create_but_not_manage(self):
+        self.client.force_authenticate(self.staff)
+        self.assertEqual(self.create().status_code, 201)
+        self.assertEqual(self.client.delete(f'/api/notices/manage/{self.notice.id}/').status_code, 403)
+
+    def test_student_can_read(self):
+        self.client.force_authenticate(self.student)
+        response = self.client.get('/api/notices/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([notice['id'] for notice in response.data['notices']], [self.notice.id])
+
+
+class NoticeAdminSearchTests(APITestCase):
+    """Admin search matches categories by their label, not the stored code"""
+
+    def test_search_by_category_label(self):
+        exam = Notice.objects.create(category='EXAMTT', audience='all', title='Finals')
+        Notice.objects.create(category='EVENTS', audience='all', title='Fest')
+        model_admin = site._registry[Notice]
+        request = RequestFactory().get('/admin/notices/notice/')
+        queryset, _ = model_admin.get_search_results(request, Notice.objects.all(), 'exam timetable')
+        self.assertEqual(list(queryset), [exam])
+        queryset, _ = model_admin.get_search_results(request, Notice.objects.filter(title='Fest'), 'exam')
+        self.assertEqual(list(queryset), [])
@@ -1,6 +1,6 @@
 from django.urls import path
 from .views import (
-    create_notice_view, list_notices_view, 
+    create_notice_view, NoticeListView, NoticeSummaryListView, export_notices_view,
     notice_detail_view, manage_notice_view
 )
 
@@ -8,7 +8,9 @@ app_name = 'notices'
 
 urlpatterns = [
     path('create/', create_notice_view, name='create'),
-    path('', list_notices_view, name='list'),
+    path('', NoticeListView.as_view(), name='list'),
+    path('summary/', NoticeSummaryListView.as_view(), name='summary'),
+    path('export/', export_notices_view, name='export'),
     path('<int:notice_id>/', notice_detail_view, name='detail'),
     path('manage/<int:notice_id>/', manage_notice_view, name='manage'),
 ]
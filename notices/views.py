@@ -1,28 +1,42 @@
-from rest_framework import status
+from rest_framework import status, generics
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from itertools import islice
+import json
 import logging
-from .models import Notice
+from users.permissions import IsAdmin, IsAdminOrStaff
+from .models import Notice, Category
 from .serializers import NoticeSerializer, NoticeCreateSerializer
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming the full notice export
+EXPORT_CHUNK_SIZE = 2000
+
+# Columns returned by the lightweight notice summary list
+SUMMARY_FIELDS = (
+    'id', 'category', 'audience', 'title', 'priority', 'created_at',
+    'posted_by__first_name', 'posted_by__last_name'
+)
+
+_CATEGORY_LABELS = dict(Category.choices)
+
+# Roles that see staff-only notices
+STAFF_LIKE_ROLES = frozenset({'admin', 'staff'})
+
 
 @api_view(['POST'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAdminOrStaff])
 def create_notice_view(request):
     """
     Create a new notice (Admin and Staff only)
     POST /api/notices/create/
     """
-    # Check if user has permission (admin or staff)
-    if request.user.role not in ['admin', 'staff']:
-        return Response(
-            {'error': 'Only staff and admin can create notices.'},
-            status=status.HTTP_403_FORBIDDEN
-        )
-    
     # Log minimal information for security
     serializer = NoticeCreateSerializer(data=request.data, context={'request': request})
     
@@ -31,11 +45,11 @@ def create_notice_view(request):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     try:
-        notice = serializer.save()
+        serializer.save()
         logger.info("Notice created successfully")
         return Response({
             'message': 'Notice created successfully',
-            'notice': NoticeSerializer(notice).data
+            'notice': serializer.data
         }, status=status.HTTP_201_CREATED)
     except Exception as e:
         logger.error("Error creating notice", exc_info=True)
@@ -45,26 +59,85 @@ def create_notice_view(request):
         )
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def list_notices_view(request):
+class NoticeCursorPagination(CursorPagination):
+    """Newest-first cursor pagination backed by the (audience, created_at) index"""
+    ordering = '-created_at'
+    page_size = 20
+
+    def get_paginated_response(self, data):
+        # No total count: cursor pages never run the COUNT(*) it would need
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'notices': data
+        })
+
+
+class NoticeListView(generics.ListAPIView):
     """
     List notices based on user role
     GET /api/notices/
     """
-    user = request.user
-    # Filter notices based on user role
-    if user.role == 'admin' or user.role == 'staff':
-        # Staff and admin can see all notices
-        notices = Notice.objects.all().order_by('-created_at')
-    else:
+    serializer_class = NoticeSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = NoticeCursorPagination
+
+    def get_queryset(self):
+        role = self.request.user.role
+        # Filter notices based on user role
+        if role in STAFF_LIKE_ROLES:
+            # Staff and admin can see all notices
+            return Notice.objects.select_related('posted_by').all()
         # Students can only see "all users" notices
-        notices = Notice.objects.filter(audience='all').order_by('-created_at')
-    serializer = NoticeSerializer(notices, many=True)
-    return Response({
-        'count': notices.count(),
-        'notices': serializer.data
-    }, status=status.HTTP_200_OK)
+        return Notice.objects.filter(audience='all').select_related('posted_by')
+
+
+class NoticeSummaryListView(NoticeListView):
+    """
+    List a few columns per notice for list screens, without building model instances
+    GET /api/notices/summary/
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().values(*SUMMARY_FIELDS)
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        notices = []
+        for row in page:
+            first_name = row.pop('posted_by__first_name')
+            last_name = row.pop('posted_by__last_name')
+            row['category'] = _CATEGORY_LABELS.get(row['category'], row['category'])
+            row['posted_by_name'] = f"{first_name} {last_name}" if first_name is not None else None
+            notices.append(row)
+        return self.get_paginated_response(notices)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdmin])
+def export_notices_view(request):
+    """
+    Stream every notice as a JSON array (Admin only)
+    GET /api/notices/export/
+    """
+    rows = Notice.objects.select_related('posted_by').order_by('-created_at').iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    )
+
+    def stream():
+        # Serialize one chunk at a time so only a single chunk is held in memory
+        yield '['
+        first = True
+        while True:
+            chunk = list(islice(rows, EXPORT_CHUNK_SIZE))
+            if not chunk:
+                break
+            for item in NoticeSerializer(chunk, many=True).data:
+                yield ('' if first else ',') + json.dumps(item, cls=JSONEncoder)
+                first = False
+        yield ']'
+
+    return StreamingHttpResponse(stream(), content_type='application/json')
 
 
 @api_view(['GET'])
@@ -74,47 +147,28 @@ def notice_detail_view(request, notice_id):
     Get a specific notice
     GET /api/notices/{id}/
     """
-    try:
-        notice = Notice.objects.get(id=notice_id)
-        
-        # Check if user has permission to view this notice
-        if notice.audience == 'staff' and request.user.role == 'student':
-            return Response(
-                {'error': 'You do not have permission to view this notice.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
-        serializer = NoticeSerializer(notice)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-    except Notice.DoesNotExist:
+    notice = get_object_or_404(Notice.objects.select_related('posted_by'), id=notice_id)
+    
+    # Check if user has permission to view this notice
+    if notice.audience == 'staff' and request.user.role == 'student':
         return Response(
-            {'error': 'Notice not found.'},
-            status=status.HTTP_404_NOT_FOUND
+            {'error': 'You do not have permission to view this notice.'},
+            status=status.HTTP_403_FORBIDDEN
         )
+    
+    serializer = NoticeSerializer(notice)
+    return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 @api_view(['PUT', 'PATCH', 'DELETE'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAdmin])
 def manage_notice_view(request, notice_id):
     """
     Update or delete a notice (Admin only)
     PUT/PATCH /api/notices/<notice_id>/
     DELETE /api/notices/<notice_id>/
     """
-    # Check if user has permission (admin only)
-    if request.user.role != 'admin':
-        return Response(
-            {'error': 'Only admins can manage notices.'},
-            status=status.HTTP_403_FORBIDDEN
-        )
-    
-    try:
-        notice = Notice.objects.get(id=notice_id)
-    except Notice.DoesNotExist:
-        return Response(
-            {'error': 'Notice not found.'},
-            status=status.HTTP_404_NOT_FOUND
-        )
+    notice = get_object_or_404(Notice.objects.select_related('posted_by'), id=notice_id)
     
     if request.method in ['PUT', 'PATCH']:
         # For partial updates, use partial=True
@@ -133,10 +187,10 @@ def manage_notice_view(request, notice_id):
             )
         
         try:
-            updated_notice = serializer.save()
+            serializer.save()
             return Response({
                 'message': 'Notice updated successfully',
-                'notice': NoticeSerializer(updated_notice).data
+                'notice': serializer.data
             }, status=status.HTTP_200_OK)
         except Exception as e:
             return Response(
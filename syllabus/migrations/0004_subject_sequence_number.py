@@ -0,0 +1,56 @@
+# Generated by Django 5.2.7 on 2026-10-14 12:18
+
+from django.db import migrations, models
+
+
+def backfill_sequence_numbers(apps, schema_editor):
+    """Recover each subject's sequence from its existing code"""
+    Subject = apps.get_model('syllabus', 'Subject')
+    used = {}
+    pending = []
+    for subject in Subject.objects.order_by('id'):
+        group = (subject.department, subject.semester)
+        prefix = f"{subject.department.upper()}{subject.semester}"
+        # A code from another group (e.g. a subject moved before this
+        # migration) says nothing about this group's sequence
+        seq = 0
+        if subject.subject_code and subject.subject_code.startswith(prefix):
+            try:
+                seq = int(subject.subject_code[len(prefix):])
+            except ValueError:
+                pass
+        group_used = used.setdefault(group, set())
+        if seq < 1 or seq in group_used:
+            pending.append(subject)
+            continue
+        group_used.add(seq)
+        subject.sequence_number = seq
+        subject.save(update_fields=['sequence_number'])
+
+    # Codes that could not be parsed, came from another group or collided
+    # get the next free number
+    for subject in pending:
+        group = used.setdefault((subject.department, subject.semester), set())
+        subject.sequence_number = max(group, default=0) + 1
+        group.add(subject.sequence_number)
+        subject.save(update_fields=['sequence_number'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('syllabus', '0003_alter_subject_options_alter_subject_department_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subject',
+            name='sequence_number',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Position of this subject within its department and semester'),
+        ),
+        migrations.RunPython(backfill_sequence_numbers, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='subject',
+            constraint=models.UniqueConstraint(fields=('department', 'semester', 'sequence_number'), name='unique_subject_sequence_per_semester'),
+        ),
+    ]
@@ -1,5 +1,4 @@
-from django.db import models
-from django.db.models import Max
+from django.db import models, transaction
 
 DEPARTMENT_CHOICES = [
     ("CS", "Computer Science & Engineering"),
@@ -10,8 +9,15 @@ DEPARTMENT_CHOICES = [
     ("IT", "Information Technology"),
 ]
 
+# Precomputed lookups for validating department codes
+VALID_DEPARTMENT_CODES = frozenset(code for code, _ in DEPARTMENT_CHOICES)
+VALID_DEPARTMENT_CODES_LIST = [code for code, _ in DEPARTMENT_CHOICES]
+
 SEMESTER_CHOICES = [(i, f"Semester {i}") for i in range(1, 9)]
 
+VALID_SEMESTERS = frozenset(sem for sem, _ in SEMESTER_CHOICES)
+VALID_SEMESTERS_LIST = [sem for sem, _ in SEMESTER_CHOICES]
+
 
 class Subject(models.Model):
     name = models.CharField(max_length=150)
@@ -23,40 +29,60 @@ class Subject(models.Model):
     )
     department = models.CharField(max_length=10, choices=DEPARTMENT_CHOICES)
     semester = models.IntegerField(choices=SEMESTER_CHOICES)
+    sequence_number = models.PositiveIntegerField(
+        editable=False,
+        default=0,
+        help_text="Position of this subject within its department and semester"
+    )
     
     def generate_subject_code(self):
         """Generate subject code in format: {dept}{semester}{2-digit-number}"""
         # Get department code (first 2-3 letters)
         dept_code = self.department.upper()
         
-        # Get the next sequence number for this department + semester
-        last_subject = Subject.objects.filter(
+        # Get the next sequence number for this department + semester.
+        # The row lock serializes concurrent creates in the same group; the
+        # unique constraint catches the case where the group is still empty.
+        last_sequence = Subject.objects.select_for_update().filter(
             department=self.department,
             semester=self.semester
-        ).order_by('-subject_code').first()
-        
-        if last_subject and last_subject.subject_code:
-            # Extract the last sequence number and increment
-            last_code = last_subject.subject_code
-            try:
-                # Extract the numeric part after department and semester
-                seq_num = int(last_code[len(dept_code) + 1:]) + 1
-            except (ValueError, IndexError):
-                seq_num = 1
-        else:
-            seq_num = 1
+        ).order_by('-sequence_number').values_list('sequence_number', flat=True).first()
+        self.sequence_number = (last_sequence or 0) + 1
             
         # Format the code: CSE1101, CSE1102, etc.
-        return f"{dept_code}{self.semester}{seq_num:02d}"
+        return f"{dept_code}{self.semester}{self.sequence_number:02d}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored group so save() can tell when it changes
+        if 'department' in field_names and 'semester' in field_names:
+            instance._loaded_group = (instance.department, instance.semester)
+        return instance
+
     def save(self, *args, **kwargs):
-        if not self.subject_code:  # Only generate code if it doesn't exist
-            self.subject_code = self.generate_subject_code()
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            loaded_group = getattr(self, '_loaded_group', None)
+            moved = loaded_group is not None and loaded_group != (self.department, self.semester)
+            # Generate a code for new subjects, and a fresh one (with its
+            # sequence) when the subject moves to another department/semester
+            if not self.subject_code or moved:
+                self.subject_code = self.generate_subject_code()
+                update_fields = kwargs.get('update_fields')
+                if update_fields is not None:
+                    kwargs['update_fields'] = {*update_fields, 'subject_code', 'sequence_number'}
+            super().save(*args, **kwargs)
+            self._loaded_group = (self.department, self.semester)
 
     class Meta:
         unique_together = ("name", "department", "semester")
         ordering = ['department', 'semester', 'name']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['department', 'semester', 'sequence_number'],
+                name='unique_subject_sequence_per_semester'
+            )
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.department} - Sem {self.semester}"
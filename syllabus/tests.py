@@ -1,3 +1,106 @@
-from django.test import TestCase
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from rest_framework.test import APITestCase, APITransactionTestCase
 
-# Create your tests here.
+from users.models import User
+from .models import Subject, Syllabus
+
+
+class SequenceNumberBackfillTests(TransactionTestCase):
+    """Migration 0004 recovers sequence numbers from existing subject codes"""
+    before = [('syllabus', '0003_alter_subject_options_alter_subject_department_and_more')]
+    after = [('syllabus', '0004_subject_sequence_number')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        # Leave the schema at the latest migration for the other tests
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_legacy_unparseable_and_foreign_codes(self):
+        Subject = self.migrate(self.before).get_model('syllabus', 'Subject')
+        parsed = Subject.objects.create(name='Networks', subject_code='IT201', department='IT', semester=2)
+        legacy = Subject.objects.create(name='Compilers', subject_code='1', department='IT', semester=2)
+        other = Subject.objects.create(name='Graphics', subject_code='ABC', department='IT', semester=2)
+        lone = Subject.objects.create(name='Circuits', subject_code='X', department='EE', semester=3)
+        # Moved from CS semester 2 before the migration; its suffix is not an IT/2 sequence
+        moved = Subject.objects.create(name='Databases', subject_code='CS205', department='IT', semester=2)
+
+        Subject = self.migrate(self.after).get_model('syllabus', 'Subject')
+        sequences = dict(Subject.objects.values_list('id', 'sequence_number'))
+        self.assertEqual(sequences[parsed.id], 1)
+        self.assertEqual({sequences[legacy.id], sequences[other.id], sequences[moved.id]}, {2, 3, 4})
+        self.assertEqual(sequences[lone.id], 1)
+
+
+class SubjectGroupChangeTests(APITestCase):
+    """Moving a subject to another department/semester gives it a new code"""
+
+    def setUp(self):
+        staff = User.objects.create_user(
+            email='staff@example.com', password='pass12345',
+            first_name='Sam', last_name='Staff', is_staff=True
+        )
+        self.client.force_authenticate(staff)
+        self.cs = Subject.objects.create(name='Algorithms', department='CS', semester=2)
+        self.it = Subject.objects.create(name='Networks', department='IT', semester=2)
+
+    def test_patch_department_reassigns_code(self):
+        response = self.client.patch(
+            f'/api/syllabus/subjects/{self.cs.id}/', {'department': 'IT'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['subject_code'], 'IT202')
+        self.cs.refresh_from_db()
+        self.assertEqual((self.cs.department, self.cs.sequence_number), ('IT', 2))
+
+    def test_save_without_group_change_keeps_code(self):
+        subject = Subject.objects.get(pk=self.cs.pk)
+        subject.name = 'Advanced Algorithms'
+        subject.save()
+        subject.refresh_from_db()
+        self.assertEqual(subject.subject_code, 'CS201')
+
+
+class SyllabusUploadMixin:
+    """A staff client and one subject for POST /api/syllabus/syllabus/"""
+
+    def setUp(self):
+        staff = User.objects.create_user(
+            email='staff@example.com', password='pass12345',
+            first_name='Sam', last_name='Staff', is_staff=True
+        )
+        self.client.force_authenticate(staff)
+        self.subject = Subject.objects.create(name='Algorithms', department='CS', semester=2)
+
+    def upload(self, subject_id, pdf_url='https://example.com/a.pdf'):
+        return self.client.post(
+            '/api/syllabus/syllabus/', {'subject': subject_id, 'pdf_url': pdf_url}, format='json'
+        )
+
+
+class SyllabusUploadTests(SyllabusUploadMixin, APITestCase):
+    """POST /api/syllabus/syllabus/ upserts the one syllabus per subject"""
+
+    def test_create_then_update(self):
+        self.assertEqual(self.upload(self.subject.id).status_code, 201)
+        response = self.upload(self.subject.id, 'https://example.com/b.pdf')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['pdf_url'], 'https://example.com/b.pdf')
+
+    def test_non_integer_subject(self):
+        self.assertEqual(self.upload('abc').status_code, 400)
+
+
+class SyllabusUnknownSubjectTests(SyllabusUploadMixin, APITransactionTestCase):
+    """Unknown subjects fail the deferred foreign key check, which needs a real commit"""
+
+    def test_unknown_subject(self):
+        self.assertEqual(self.upload(self.subject.id + 100).status_code, 404)
+        self.assertFalse(Syllabus.objects.exists())
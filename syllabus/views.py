@@ -1,9 +1,13 @@
-from rest_framework import generics, status, permissions, filters
+from rest_framework import generics, status, permissions, filters, serializers
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser, BasePermission
-from .models import Subject, Syllabus, DEPARTMENT_CHOICES
+from .models import (
+    Subject, Syllabus,
+    VALID_DEPARTMENT_CODES, VALID_DEPARTMENT_CODES_LIST,
+    VALID_SEMESTERS, VALID_SEMESTERS_LIST
+)
 from .serializers import SubjectSerializer, SyllabusSerializer
-from django.db import transaction
+from django.db import transaction, IntegrityError
 from django.shortcuts import get_object_or_404
 from django.http import Http404
 from rest_framework.views import APIView
@@ -19,7 +23,7 @@ class IsStaffOrReadOnly(BasePermission):
         return request.user and request.user.is_staff
 
 class SubjectListCreateView(generics.ListCreateAPIView):
-    queryset = Subject.objects.all()
+    queryset = Subject.objects.select_related('syllabus').all()
     serializer_class = SubjectSerializer
     
     permission_classes = [IsAuthenticated, IsStaffOrReadOnly]
@@ -46,7 +50,7 @@ class SubjectListCreateView(generics.ListCreateAPIView):
 
             
 class SubjectDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Subject.objects.all()
+    queryset = Subject.objects.select_related('syllabus').all()
     serializer_class = SubjectSerializer
     permission_classes = [IsAuthenticated, IsStaffOrReadOnly]
     lookup_field = 'id'
@@ -58,13 +62,10 @@ class SubjectDetailView(generics.RetrieveUpdateDestroyAPIView):
         
         # Handle syllabus update or creation
         if pdf_url:
-            syllabus, created = Syllabus.objects.get_or_create(
+            Syllabus.objects.update_or_create(
                 subject=instance,
                 defaults={'pdf_url': pdf_url}
             )
-            if not created:
-                syllabus.pdf_url = pdf_url
-                syllabus.save()
         
         return super().update(request, *args, **kwargs)
 
@@ -95,7 +96,6 @@ class SyllabusListCreateView(generics.ListCreateAPIView):
             
         return queryset
     
-    @transaction.atomic
     def create(self, request, *args, **kwargs):
         subject_id = request.data.get('subject')
         pdf_url = request.data.get('pdf_url')
@@ -107,18 +107,32 @@ class SyllabusListCreateView(generics.ListCreateAPIView):
             )
             
         try:
-            subject = Subject.objects.get(id=subject_id)
-        except Subject.DoesNotExist:
+            subject_id = int(subject_id)
+        except (TypeError, ValueError):
             return Response(
-                {'error': 'Subject not found'},
-                status=status.HTTP_404_NOT_FOUND
+                {'error': 'Subject ID must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
             )
             
-        # Check if syllabus already exists for this subject
-        syllabus, created = Syllabus.objects.update_or_create(
-            subject=subject,
-            defaults={'pdf_url': pdf_url}
-        )
+        # Upsert directly and let the foreign key reject unknown subjects. The
+        # FK check is deferred to commit, so the except wraps the whole block
+        try:
+            with transaction.atomic():
+                syllabus, created = Syllabus.objects.select_related('subject').update_or_create(
+                    subject_id=subject_id,
+                    defaults={'pdf_url': pdf_url}
+                )
+        except IntegrityError:
+            # Only the failure path pays for telling the two causes apart
+            if not Subject.objects.filter(pk=subject_id).exists():
+                return Response(
+                    {'error': 'Subject not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            return Response(
+                {'error': 'A syllabus for this subject was uploaded concurrently, please retry'},
+                status=status.HTTP_409_CONFLICT
+            )
         
         serializer = self.get_serializer(syllabus)
         return Response(
@@ -149,27 +163,26 @@ class DepartmentSubjectsView(generics.ListAPIView):
         if department:
             department = department.upper()
             
-        # Use the imported DEPARTMENT_CHOICES
-        valid_departments = dict(DEPARTMENT_CHOICES).keys()
-        
-        if department not in valid_departments:
+        if department not in VALID_DEPARTMENT_CODES:
             raise serializers.ValidationError({
-                'department': f'Invalid department code. Must be one of: {list(valid_departments)}',
-                'valid_departments': list(valid_departments)  # Include valid options in response
+                'department': f'Invalid department code. Must be one of: {VALID_DEPARTMENT_CODES_LIST}',
+                'valid_departments': VALID_DEPARTMENT_CODES_LIST  # Include valid options in response
             })
         
-        queryset = Subject.objects.filter(department=department).prefetch_related('syllabus')
+        queryset = Subject.objects.filter(department=department).select_related('syllabus')
         
         # Get semester from query params if provided
         semester = self.request.query_params.get('semester')
         if semester:
             try:
                 semester = int(semester)
-                queryset = queryset.filter(semester=semester)
             except (ValueError, TypeError):
+                semester = None
+            if semester not in VALID_SEMESTERS:
                 raise serializers.ValidationError({
                     'semester': 'Semester must be a number between 1 and 8',
-                    'valid_semesters': list(range(1, 9))  # Include valid options in response
+                    'valid_semesters': VALID_SEMESTERS_LIST  # Include valid options in response
                 })
+            queryset = queryset.filter(semester=semester)
             
         return queryset
@@ -33,6 +33,7 @@ class StudentAdmin(admin.ModelAdmin):
     list_filter = ('department', 'gender', 'enrollment_date')
     search_fields = ('student_id', 'user__email', 'user__first_name', 'user__last_name', 'department')
     ordering = ('-enrollment_date',)
+    list_select_related = ('user',)
     readonly_fields = ('created_at', 'updated_at', 'enrollment_date')
     
     fieldsets = (
@@ -58,6 +59,7 @@ class StaffAdmin(admin.ModelAdmin):
     list_filter = ('department', 'designation', 'gender', 'joining_date')
     search_fields = ('staff_id', 'user__email', 'user__first_name', 'user__last_name', 'department', 'designation')
     ordering = ('-joining_date',)
+    list_select_related = ('user',)
     readonly_fields = ('created_at', 'updated_at', 'joining_date')
     
     fieldsets = (
@@ -68,7 +70,7 @@ class StaffAdmin(admin.ModelAdmin):
             'fields': ('date_of_birth', 'gender', 'phone', 'address')
         }),
         ('Professional Information', {
-            'fields': ('department', 'designation', 'qualification', 'joining_date', 'salary')
+            'fields': ('department', 'designation', 'qualification', 'joining_date', 'salary_cents')
         }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at')
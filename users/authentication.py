@@ -0,0 +1,38 @@
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+# Seconds an authenticated user is reused across requests. The default cache
+# is per-process, so deactivations made elsewhere apply within this window
+AUTH_USER_TTL = 60
+
+
+def auth_user_key(user_id):
+    return f'user:auth:{user_id}'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that keeps the token's user in the cache, skipping the
+    user SELECT on every authenticated request. Only users that passed
+    JWTAuthentication's active check are cached.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Revocation compares the current password hash; always read it fresh
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        key = auth_user_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, AUTH_USER_TTL)
+        return user
@@ -0,0 +1,12 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id at the OWASP minimum profile (19 MiB, 2 passes, 1 lane).
+    Keeps the 'argon2' algorithm name, so hashes made with Django's default
+    parameters still verify and get upgraded on the next login.
+    """
+    time_cost = 2
+    memory_cost = 19456
+    parallelism = 1
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-14 12:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_headofdepartment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='headofdepartment',
+            index=models.Index(fields=['department', 'is_active'], name='hod_dept_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='staff',
+            index=models.Index(fields=['department', '-joining_date'], name='staff_dept_joined_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['department', '-enrollment_date'], name='student_dept_enrolled_idx'),
+        ),
+    ]
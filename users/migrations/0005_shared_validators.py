@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-14 12:24
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_profile_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='staff',
+            name='phone',
+            field=models.CharField(blank=True, max_length=15, null=True, validators=[django.core.validators.RegexValidator(message='Phone number must be entered in the format: "+999999999". Up to 15 digits allowed.', regex=re.compile('^\\+?1?\\d{9,15}$'))]),
+        ),
+        migrations.AlterField(
+            model_name='staff',
+            name='staff_id',
+            field=models.CharField(help_text='Unique staff identification number', max_length=50, unique=True, validators=[django.core.validators.RegexValidator(message='Staff ID must contain only uppercase letters and numbers.', regex=re.compile('^[A-Z0-9]+$'))]),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='phone',
+            field=models.CharField(blank=True, max_length=15, null=True, validators=[django.core.validators.RegexValidator(message='Phone number must be entered in the format: "+999999999". Up to 15 digits allowed.', regex=re.compile('^\\+?1?\\d{9,15}$'))]),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='student_id',
+            field=models.CharField(help_text='Unique student identification number', max_length=50, unique=True, validators=[django.core.validators.RegexValidator(message='Student ID must contain only uppercase letters and numbers.', regex=re.compile('^[A-Z0-9]+$'))]),
+        ),
+    ]
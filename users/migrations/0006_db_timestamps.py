@@ -0,0 +1,95 @@
+# Generated by Django 5.2.7 on 2026-10-14 12:26
+
+import django.db.models.functions.comparison
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+TIMESTAMPED_TABLES = ('users', 'students', 'staff', 'head_of_department')
+
+
+def create_updated_at_triggers(apps, schema_editor):
+    # updated_at replaces auto_now; PostgreSQL bumps it on every UPDATE
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = NOW();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TIMESTAMPED_TABLES:
+        schema_editor.execute(
+            f'CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON "{table}" '
+            f'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+
+
+def drop_updated_at_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in TIMESTAMPED_TABLES:
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {table}_set_updated_at ON "{table}"')
+    schema_editor.execute('DROP FUNCTION IF EXISTS set_updated_at()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_shared_validators'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='headofdepartment',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='headofdepartment',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='staff',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='staff',
+            name='joining_date',
+            field=models.DateField(db_default=django.db.models.functions.comparison.Cast(django.db.models.functions.datetime.Now(), models.DateField()), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='staff',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='enrollment_date',
+            field=models.DateField(db_default=django.db.models.functions.comparison.Cast(django.db.models.functions.datetime.Now(), models.DateField()), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='date_joined',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.RunPython(create_updated_at_triggers, drop_updated_at_triggers),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-14 12:29
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    # Fails on the unique index if two accounts differ only by case; merge those first
+    User = apps.get_model('users', 'User')
+    User.objects.exclude(email=Lower('email')).update(email=Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0007_user_full_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='user_email_lower_uniq'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.7 on 2026-10-14 12:29
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Cast
+
+
+def salary_to_cents(apps, schema_editor):
+    Staff = apps.get_model('users', 'Staff')
+    Staff.objects.filter(salary__isnull=False).update(
+        salary_cents=Cast(F('salary') * 100, models.BigIntegerField())
+    )
+
+
+def cents_to_salary(apps, schema_editor):
+    Staff = apps.get_model('users', 'Staff')
+    rows = Staff.objects.filter(salary_cents__isnull=False).values_list('pk', 'salary_cents')
+    for pk, cents in rows.iterator():
+        Staff.objects.filter(pk=pk).update(salary=Decimal(cents).scaleb(-2))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_lowercase_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='staff',
+            name='salary_cents',
+            field=models.BigIntegerField(blank=True, help_text='Salary in cents (1/100 of the currency unit)', null=True),
+        ),
+        migrations.RunPython(salary_to_cents, cents_to_salary),
+        migrations.RemoveField(
+            model_name='staff',
+            name='salary',
+        ),
+        migrations.AlterField(
+            model_name='staff',
+            name='designation',
+            field=models.CharField(blank=True, help_text='e.g., Professor, Assistant Professor, Lab Assistant', max_length=60, null=True),
+        ),
+        migrations.AlterField(
+            model_name='staff',
+            name='qualification',
+            field=models.CharField(blank=True, max_length=120, null=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='first_name',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='last_name',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('admin', 'Admin'), ('staff', 'Staff'), ('student', 'Student')], default='student', max_length=8),
+        ),
+    ]
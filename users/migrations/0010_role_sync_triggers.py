@@ -0,0 +1,47 @@
+# Keeps users.role in step with the profile tables, including bulk_create
+# and raw writes that never go through Model.save()
+
+from django.db import migrations
+
+# (profile table, column holding the user id, role it implies)
+ROLE_SYNC = (
+    ('students', 'user_id', 'student'),
+    ('head_of_department', 'staff_id', 'staff'),
+)
+
+
+def create_role_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column, role in ROLE_SYNC:
+        schema_editor.execute(f"""
+            CREATE OR REPLACE FUNCTION {table}_sync_role() RETURNS trigger AS $$
+            BEGIN
+                UPDATE users SET role = '{role}' WHERE id = NEW.{column} AND role <> '{role}';
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        schema_editor.execute(
+            f'CREATE TRIGGER {table}_sync_role AFTER INSERT OR UPDATE OF {column} ON "{table}" '
+            f'FOR EACH ROW EXECUTE FUNCTION {table}_sync_role()'
+        )
+
+
+def drop_role_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column, role in ROLE_SYNC:
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {table}_sync_role ON "{table}"')
+        schema_editor.execute(f'DROP FUNCTION IF EXISTS {table}_sync_role()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0009_compact_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_role_triggers, drop_role_triggers),
+    ]
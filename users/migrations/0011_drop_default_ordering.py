@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-14 12:31
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_role_sync_triggers'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='headofdepartment',
+            options={'verbose_name': 'Head of Department', 'verbose_name_plural': 'Heads of Department'},
+        ),
+        migrations.AlterModelOptions(
+            name='staff',
+            options={'verbose_name': 'Staff', 'verbose_name_plural': 'Staff'},
+        ),
+        migrations.AlterModelOptions(
+            name='student',
+            options={'verbose_name': 'Student', 'verbose_name_plural': 'Students'},
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Compares student and staff IDs byte-wise on PostgreSQL. IDs are limited to
+# [A-Z0-9], so the "C" collation orders them the same as the locale would
+
+from django.db import migrations
+
+# (table, column) pairs switched to the "C" collation
+C_COLLATED_COLUMNS = (
+    ('students', 'student_id'),
+    ('staff', 'staff_id'),
+)
+
+
+def use_c_collation(apps, schema_editor):
+    # Other backends have no "C" collation; the column stays on the default
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in C_COLLATED_COLUMNS:
+        schema_editor.execute(
+            f'ALTER TABLE "{table}" ALTER COLUMN "{column}" TYPE varchar(50) COLLATE "C"'
+        )
+
+
+def use_default_collation(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in C_COLLATED_COLUMNS:
+        schema_editor.execute(
+            f'ALTER TABLE "{table}" ALTER COLUMN "{column}" TYPE varchar(50) COLLATE "default"'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_drop_default_ordering'),
+    ]
+
+    operations = [
+        migrations.RunPython(use_c_collation, use_default_collation),
+    ]
@@ -1,11 +1,71 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from decimal import Decimal
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.db import models, transaction
+from django.db.models import ExpressionWrapper, F, Value
+from django.db.models.functions import Cast, Coalesce, Concat, Lower, Now
+from django.utils import timezone
 from django.core.validators import RegexValidator
 
 
+# Threads used by bulk_create_users; each Argon2 hash holds ~19 MiB while running
+PASSWORD_HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+# Shared field validators, compiled once at import. IDs are ASCII-only, which
+# is what lets their columns use the byte-wise "C" collation on PostgreSQL
+# (migration 0012; kept out of the field so other backends still migrate).
+# An AlterField that retypes student_id/staff_id must re-apply COLLATE "C"
+_ID_PATTERN = re.compile(r'^[A-Z0-9]+$')
+_STUDENT_ID_VALIDATOR = RegexValidator(
+    regex=_ID_PATTERN,
+    message='Student ID must contain only uppercase letters and numbers.'
+)
+_STAFF_ID_VALIDATOR = RegexValidator(
+    regex=_ID_PATTERN,
+    message='Staff ID must contain only uppercase letters and numbers.'
+)
+_PHONE_VALIDATOR = RegexValidator(
+    regex=re.compile(r'^\+?1?\d{9,15}$'),
+    message='Phone number must be entered in the format: "+999999999". Up to 15 digits allowed.'
+)
+
+
+class Role(models.TextChoices):
+    ADMIN = 'admin', 'Admin'
+    STAFF = 'staff', 'Staff'
+    STUDENT = 'student', 'Student'
+
+
+class Gender(models.TextChoices):
+    MALE = 'M', 'Male'
+    FEMALE = 'F', 'Female'
+    OTHER = 'O', 'Other'
+
+
+class Department(models.TextChoices):
+    IT = 'IT', 'Information Technology'
+    CS = 'CS', 'Computer Science'
+    EE = 'EE', 'Electrical Engineering'
+    ME = 'ME', 'Mechanical Engineering'
+    CE = 'CE', 'Civil Engineering'
+    ADMIN = 'ADMIN', 'Administration'
+    ACCOUNTS = 'ACCOUNTS', 'Accounts'
+    LIBRARY = 'LIBRARY', 'Library'
+    OTHER = 'OTHER', 'Other'
+
+
 class UserManager(BaseUserManager):
     """Custom user manager for handling user creation"""
     
+    @classmethod
+    def normalize_email(cls, email):
+        """Lowercase the whole address so lookups are plain equality on the email index"""
+        return super().normalize_email(email).lower()
+    
     def create_user(self, email, password=None, **extra_fields):
         """Create and save a regular user"""
         if not email:
@@ -20,7 +80,7 @@ class UserManager(BaseUserManager):
         """Create and save a superuser"""
         extra_fields.setdefault('is_staff', True)
         extra_fields.setdefault('is_superuser', True)
-        extra_fields.setdefault('role', 'admin')
+        extra_fields.setdefault('role', Role.ADMIN)
         
         if extra_fields.get('is_staff') is not True:
             raise ValueError('Superuser must have is_staff=True.')
@@ -28,25 +88,145 @@ class UserManager(BaseUserManager):
             raise ValueError('Superuser must have is_superuser=True.')
         
         return self.create_user(email, password, **extra_fields)
+    
+    def bulk_create_users(self, records, batch_size=500):
+        """
+        Create users from dicts of create_user() arguments in batched INSERTs.
+        Passwords are hashed on a thread pool, argon2 releases the GIL while hashing.
+        """
+        records = list(records)
+        if not all(record.get('email') for record in records):
+            raise ValueError('The Email field must be set')
+        
+        with ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS) as pool:
+            hashes = list(pool.map(make_password, (record.get('password') for record in records)))
+        
+        users = []
+        for record, password in zip(records, hashes):
+            extra_fields = {k: v for k, v in record.items() if k not in ('email', 'password')}
+            users.append(self.model(
+                email=self.normalize_email(record['email']),
+                password=password,
+                **extra_fields
+            ))
+        return self.bulk_create(users, batch_size=batch_size)
+
+
+# User columns rendered by the profile list endpoints; the rest of the user
+# row (password hash, last_login, permission flags) is left in the database
+LIST_USER_FIELDS = (
+    'user__email', 'user__first_name', 'user__last_name', 'user__full_name',
+    'user__role', 'user__is_active'
+)
+
+
+def _list_queryset(queryset, list_columns, fields=None):
+    """
+    Restrict a profile queryset to the columns behind the given serializer
+    fields (all of list_columns when fields is None)
+    """
+    if fields is not None:
+        list_columns = {name: columns for name, columns in list_columns.items() if name in fields}
+        if 'user' not in list_columns:
+            # A deferred user can't also be joined by select_related()
+            queryset = queryset.select_related(None)
+    return queryset.only(*chain.from_iterable(list_columns.values()) or ('pk',))
+
+
+class StudentManager(models.Manager):
+    """Student manager that always joins the related user"""
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+    
+    # Columns loaded by for_list(), keyed by the serializer field that renders them
+    LIST_COLUMNS = {
+        'user': LIST_USER_FIELDS,
+        **{name: (name,) for name in (
+            'student_id', 'date_of_birth', 'gender', 'phone', 'address',
+            'enrollment_date', 'department', 'created_at', 'updated_at'
+        )},
+    }
+    
+    def for_list(self, fields=None):
+        """
+        Students with only the user columns list endpoints render, optionally
+        narrowed to the given serializer field names
+        """
+        return _list_queryset(self.get_queryset(), self.LIST_COLUMNS, fields)
+
+
+class StaffManager(models.Manager):
+    """Staff manager that always joins the related user"""
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+    
+    # Columns loaded by for_list(), keyed by the serializer field that renders them
+    LIST_COLUMNS = {
+        'user': LIST_USER_FIELDS,
+        'salary': ('salary_cents',),
+        **{name: (name,) for name in (
+            'staff_id', 'date_of_birth', 'gender', 'phone', 'address',
+            'department', 'designation', 'qualification', 'joining_date',
+            'created_at', 'updated_at'
+        )},
+    }
+    
+    def for_list(self, fields=None):
+        """
+        Staff members with only the user columns list endpoints render,
+        optionally narrowed to the given serializer field names
+        """
+        return _list_queryset(self.get_queryset(), self.LIST_COLUMNS, fields)
+
+
+class HeadOfDepartmentManager(models.Manager):
+    """HOD manager that always joins the staff member and their user"""
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('staff__user')
+    
+    def for_list(self):
+        """HODs with just the staff ID and full name from the joined rows, plus tenure"""
+        return self.with_duration().only(
+            'staff', 'department', 'start_date', 'end_date', 'is_active',
+            'additional_responsibilities', 'created_at', 'updated_at',
+            'staff__staff_id', 'staff__user__full_name'
+        )
+    
+    def with_duration(self):
+        """HODs annotated with their tenure as an interval, so it can be sorted and filtered in SQL"""
+        today = Cast(Now(), models.DateField())
+        # A plain date subtraction; Django emulates it on backends without
+        # native intervals, unlike ExtractDay on the result
+        return self.get_queryset().annotate(
+            tenure=ExpressionWrapper(
+                Coalesce('end_date', today) - F('start_date'),
+                output_field=models.DurationField()
+            )
+        )
 
 
 class User(AbstractBaseUser, PermissionsMixin):
     """Custom User model for college portal"""
     
-    ROLE_CHOICES = [
-        ('admin', 'Admin'),
-        ('staff', 'Staff'),
-        ('student', 'Student'),
-    ]
+    ROLE_CHOICES = Role.choices
     
     email = models.EmailField(unique=True)
-    first_name = models.CharField(max_length=100)
-    last_name = models.CharField(max_length=100)
-    role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='student')
+    first_name = models.CharField(max_length=50)
+    last_name = models.CharField(max_length=50)
+    # Stored concatenation maintained by the database, indexed for name lookups
+    full_name = models.GeneratedField(
+        expression=Concat('first_name', Value(' '), 'last_name'),
+        output_field=models.CharField(max_length=201),
+        db_persist=True
+    )
+    role = models.CharField(max_length=8, choices=Role.choices, default=Role.STUDENT)
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
-    date_joined = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    date_joined = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)  # bumped by a database trigger
     
     objects = UserManager()
     
@@ -57,37 +237,53 @@ class User(AbstractBaseUser, PermissionsMixin):
         db_table = 'users'
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['full_name'], name='user_full_name_idx'),
+        ]
+        constraints = [
+            # Guards writes that bypass normalize_email against case-variant duplicates
+            models.UniqueConstraint(Lower('email'), name='user_email_lower_uniq'),
+        ]
+    
+    # Memoized __str__ value, cleared on save
+    _str_cache = None
     
     def __str__(self):
-        return f"{self.email} ({self.role})"
+        if self._str_cache is None:
+            self._str_cache = f"{self.email} ({self.role})"
+        return self._str_cache
     
     def get_full_name(self):
+        # Built from the name fields so unsaved and just-edited users are right;
+        # the full_name column is for queries, and only stands in for the
+        # name fields when a projection loaded it without them
+        if 'full_name' in self.__dict__ and not {'first_name', 'last_name'} <= self.__dict__.keys():
+            return self.full_name
         return f"{self.first_name} {self.last_name}"
     
     def get_short_name(self):
         return self.first_name
+    
+    def save(self, *args, **kwargs):
+        # Email or role may have changed; drop the memoized string
+        self._str_cache = None
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if not adding:
+            # An UPDATE doesn't return the regenerated full_name; defer it so
+            # the next access reloads it
+            self.__dict__.pop('full_name', None)
 
 
 class Student(models.Model):
-    """Student model with OneToOne relationship to User"""
+    """
+    Student model with OneToOne relationship to User.
+    The user's role is kept at 'student' by a database trigger (migration 0010).
+    """
 
-    DEPARTMENT_CHOICES = [
-        ('IT', 'Information Technology'),
-        ('CS', 'Computer Science'),
-        ('EE', 'Electrical Engineering'),
-        ('ME', 'Mechanical Engineering'),
-        ('CE', 'Civil Engineering'),
-        ('ADMIN', 'Administration'),
-        ('ACCOUNTS', 'Accounts'),
-        ('LIBRARY', 'Library'),
-        ('OTHER', 'Other'),
-    ]
-    
-    GENDER_CHOICES = [
-        ('M', 'Male'),
-        ('F', 'Female'),
-        ('O', 'Other'),
-    ]
+    DEPARTMENT_CHOICES = Department.choices
+    
+    GENDER_CHOICES = Gender.choices
     
     user = models.OneToOneField(
         User,
@@ -98,70 +294,43 @@ class Student(models.Model):
     student_id = models.CharField(
         max_length=50,
         unique=True,
-        validators=[
-            RegexValidator(
-                regex=r'^[A-Z0-9]+$',
-                message='Student ID must contain only uppercase letters and numbers.'
-            )
-        ],
+        validators=[_STUDENT_ID_VALIDATOR],
         help_text='Unique student identification number'
     )
     date_of_birth = models.DateField(null=True, blank=True)
-    gender = models.CharField(max_length=1, choices=GENDER_CHOICES, null=True, blank=True)
+    gender = models.CharField(max_length=1, choices=Gender.choices, null=True, blank=True)
     phone = models.CharField(
         max_length=15,
         null=True,
         blank=True,
-        validators=[
-            RegexValidator(
-                regex=r'^\+?1?\d{9,15}$',
-                message='Phone number must be entered in the format: "+999999999". Up to 15 digits allowed.'
-            )
-        ]
+        validators=[_PHONE_VALIDATOR]
     )
     address = models.TextField(null=True, blank=True)
-    enrollment_date = models.DateField(auto_now_add=True)
-    department = models.CharField(max_length=50, choices=DEPARTMENT_CHOICES, null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    enrollment_date = models.DateField(db_default=Cast(Now(), models.DateField()), editable=False)
+    department = models.CharField(max_length=50, choices=Department.choices, null=True, blank=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
+    
+    objects = StudentManager()
     
     class Meta:
         db_table = 'students'
         verbose_name = 'Student'
         verbose_name_plural = 'Students'
-        ordering = ['-enrollment_date']
+        indexes = [
+            models.Index(fields=['department', '-enrollment_date'], name='student_dept_enrolled_idx'),
+        ]
     
     def __str__(self):
         return f"{self.student_id} - {self.user.get_full_name()}"
-    
-    def save(self, *args, **kwargs):
-        # Ensure user role is set to student
-        if self.user and self.user.role != 'student':
-            self.user.role = 'student'
-            self.user.save(update_fields=['role'])
-        super().save(*args, **kwargs)
 
 
 class Staff(models.Model):
     """Staff model with OneToOne relationship to User"""
     
-    GENDER_CHOICES = [
-        ('M', 'Male'),
-        ('F', 'Female'),
-        ('O', 'Other'),
-    ]
-    
-    DEPARTMENT_CHOICES = [
-        ('IT', 'Information Technology'),
-        ('CS', 'Computer Science'),
-        ('EE', 'Electrical Engineering'),
-        ('ME', 'Mechanical Engineering'),
-        ('CE', 'Civil Engineering'),
-        ('ADMIN', 'Administration'),
-        ('ACCOUNTS', 'Accounts'),
-        ('LIBRARY', 'Library'),
-        ('OTHER', 'Other'),
-    ]
+    GENDER_CHOICES = Gender.choices
+    
+    DEPARTMENT_CHOICES = Department.choices
     
     user = models.OneToOneField(
         User,
@@ -172,47 +341,56 @@ class Staff(models.Model):
     staff_id = models.CharField(
         max_length=50,
         unique=True,
-        validators=[
-            RegexValidator(
-                regex=r'^[A-Z0-9]+$',
-                message='Staff ID must contain only uppercase letters and numbers.'
-            )
-        ],
+        validators=[_STAFF_ID_VALIDATOR],
         help_text='Unique staff identification number'
     )
     date_of_birth = models.DateField(null=True, blank=True)
-    gender = models.CharField(max_length=1, choices=GENDER_CHOICES, null=True, blank=True)
+    gender = models.CharField(max_length=1, choices=Gender.choices, null=True, blank=True)
     phone = models.CharField(
         max_length=15,
         null=True,
         blank=True,
-        validators=[
-            RegexValidator(
-                regex=r'^\+?1?\d{9,15}$',
-                message='Phone number must be entered in the format: "+999999999". Up to 15 digits allowed.'
-            )
-        ]
+        validators=[_PHONE_VALIDATOR]
     )
     address = models.TextField(null=True, blank=True)
-    department = models.CharField(max_length=50, choices=DEPARTMENT_CHOICES, null=True, blank=True)
-    designation = models.CharField(max_length=100, null=True, blank=True, help_text='e.g., Professor, Assistant Professor, Lab Assistant')
-    qualification = models.CharField(max_length=200, null=True, blank=True)
-    joining_date = models.DateField(auto_now_add=True)
-    salary = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    department = models.CharField(max_length=50, choices=Department.choices, null=True, blank=True)
+    designation = models.CharField(max_length=60, null=True, blank=True, help_text='e.g., Professor, Assistant Professor, Lab Assistant')
+    qualification = models.CharField(max_length=120, null=True, blank=True)
+    joining_date = models.DateField(db_default=Cast(Now(), models.DateField()), editable=False)
+    salary_cents = models.BigIntegerField(null=True, blank=True, help_text='Salary in cents (1/100 of the currency unit)')
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
+    
+    objects = StaffManager()
     
     class Meta:
         db_table = 'staff'
         verbose_name = 'Staff'
         verbose_name_plural = 'Staff'
-        ordering = ['-joining_date']
+        indexes = [
+            models.Index(fields=['department', '-joining_date'], name='staff_dept_joined_idx'),
+        ]
+    
+    @property
+    def salary(self):
+        """Salary as a two-place Decimal, stored as integer cents"""
+        if self.salary_cents is None:
+            return None
+        return Decimal(self.salary_cents).scaleb(-2)
+    
+    @salary.setter
+    def salary(self, value):
+        if value is None:
+            self.salary_cents = None
+        else:
+            self.salary_cents = int((Decimal(value) * 100).to_integral_value())
 
 
 class HeadOfDepartment(models.Model):
     """
     Model to track Heads of Departments (HODs).
     Each department can have only one active HOD at a time.
+    The staff member's user role is kept at 'staff' by a database trigger.
     """
     
     staff = models.OneToOneField(
@@ -224,7 +402,7 @@ class HeadOfDepartment(models.Model):
     
     department = models.CharField(
         max_length=50,
-        choices=Staff.DEPARTMENT_CHOICES,
+        choices=Department.choices,
         help_text='Department for which this staff is the HOD'
     )
     
@@ -249,14 +427,20 @@ class HeadOfDepartment(models.Model):
         help_text='Any additional responsibilities or notes for this HOD role'
     )
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
+    
+    objects = HeadOfDepartmentManager()
     
     class Meta:
         db_table = 'head_of_department'
         verbose_name = 'Head of Department'
         verbose_name_plural = 'Heads of Department'
-        ordering = ['department', '-start_date']
+        indexes = [
+            # The partial unique constraint below only covers active rows;
+            # this one also serves the is_active=false list filter
+            models.Index(fields=['department', 'is_active'], name='hod_dept_active_idx'),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['department', 'is_active'],
@@ -269,26 +453,27 @@ class HeadOfDepartment(models.Model):
         return f"{self.staff.user.get_full_name()} - {self.get_department_display()} (HOD)"
     
     def save(self, *args, **kwargs):
-        # If this is a new active HOD assignment, deactivate any existing active HOD for this department
-        if self.is_active and not self.pk:
-            HeadOfDepartment.objects.filter(
-                department=self.department,
-                is_active=True
-            ).exclude(pk=self.pk).update(is_active=False)
-        
-        # If this HOD is being marked as inactive, ensure end_date is set
-        if not self.is_active and not self.end_date:
-            self.end_date = timezone.now().date()
-        
-        # Ensure the staff's user has the correct role
-        if self.staff and self.staff.user and self.staff.user.role != 'staff':
-            self.staff.user.role = 'staff'
-            self.staff.user.save(update_fields=['role'])
-        
-        super().save(*args, **kwargs)
+        today = timezone.localdate()
+        with transaction.atomic():
+            # If this is a new active HOD assignment, end the term of any existing
+            # active HOD for this department in the same UPDATE
+            if self.is_active and not self.pk:
+                HeadOfDepartment.objects.filter(
+                    department=self.department,
+                    is_active=True
+                ).exclude(pk=self.pk).update(is_active=False, end_date=today)
+            
+            # If this HOD is being marked as inactive, ensure end_date is set
+            if not self.is_active and not self.end_date:
+                self.end_date = today
+            
+            super().save(*args, **kwargs)
     
     @property
     def duration(self):
         """Calculate the duration of the HOD role"""
-        end = self.end_date if self.end_date else timezone.now().date()
+        # Prefer the value computed by HeadOfDepartment.objects.with_duration()
+        if 'tenure' in self.__dict__:
+            return self.tenure.days
+        end = self.end_date or timezone.localdate()
         return (end - self.start_date).days
@@ -0,0 +1,24 @@
+from rest_framework.permissions import BasePermission
+
+from .models import Role
+
+
+class HasRole(BasePermission):
+    """Allow authenticated users whose role is in `roles`"""
+    roles = frozenset()
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and user.role in self.roles)
+
+
+class IsAdmin(HasRole):
+    """Allow admin users only, by role rather than the is_staff flag"""
+    roles = frozenset({Role.ADMIN})
+    message = 'Only admins can perform this action.'
+
+
+class IsAdminOrStaff(HasRole):
+    """Allow admin and staff users"""
+    roles = frozenset({Role.ADMIN, Role.STAFF})
+    message = 'Only staff and admins can perform this action.'
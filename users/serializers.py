@@ -1,68 +1,177 @@
+import copy
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from django.contrib.auth.password_validation import validate_password
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Value
+from django.db.models.signals import pre_save, post_save
 from django.utils import timezone
-from .models import User, Student, Staff, HeadOfDepartment
+from .models import User, Student, Staff, HeadOfDepartment, Role
 
+# Optional profile fields where an empty string is stored as None
+STUDENT_OPTIONAL_FIELDS = frozenset({'date_of_birth', 'gender', 'phone', 'address', 'department'})
+STAFF_OPTIONAL_FIELDS = STUDENT_OPTIONAL_FIELDS | {'designation', 'qualification', 'salary'}
 
-class UserSerializer(serializers.ModelSerializer):
+# (request field, User field) pairs accepted by the student/staff update serializers;
+# the user_* aliases come last so they win when both are sent
+USER_FIELD_MAP = (
+    ('email', 'email'), ('first_name', 'first_name'), ('last_name', 'last_name'),
+    ('user_email', 'email'), ('user_first_name', 'first_name'), ('user_last_name', 'last_name'),
+)
+
+
+class LowercaseEmailField(serializers.EmailField):
+    """Email field that lowercases input to match the stored, lowercased emails"""
+    
+    def to_internal_value(self, data):
+        return super().to_internal_value(data).lower()
+
+
+class UppercaseChoiceField(serializers.ChoiceField):
+    """Choice field that uppercases string input before matching it against the choices"""
+    
+    def to_internal_value(self, data):
+        return super().to_internal_value(data.upper() if isinstance(data, str) else data)
+
+
+def requested_fields(request):
+    """Field names from a comma-separated ?fields= parameter on GET requests, or None"""
+    if request is None or request.method != 'GET':
+        return None
+    raw = request.query_params.get('fields')
+    if not raw:
+        return None
+    return frozenset(name for name in (part.strip() for part in raw.split(',')) if name)
+
+
+class DynamicFieldsMixin:
+    """Render only the fields named in the request's ?fields= parameter, when given"""
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = requested_fields(self.context.get('request'))
+        if requested is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in requested}
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer class's field map once and hand each instance shallow
+    copies, instead of re-running ModelSerializer introspection per instance.
+    Copies are unbound; DRF binds them to the new parent as usual.
+    """
+    _fields_cache = {}
+    
+    def get_fields(self):
+        cls = type(self)
+        template = self._fields_cache.get(cls)
+        if template is None:
+            template = self._fields_cache[cls] = super().get_fields()
+        return {name: copy.copy(field) for name, field in template.items()}
+
+
+class StudentProfileInlineSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Student profile fields embedded in user details"""
+    
+    class Meta:
+        model = Student
+        fields = ('student_id', 'date_of_birth', 'gender', 'phone', 'address',
+                  'enrollment_date', 'department')
+        read_only_fields = fields
+
+
+class StaffProfileInlineSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Staff profile fields embedded in user details"""
+    salary = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    
+    class Meta:
+        model = Staff
+        fields = ('staff_id', 'date_of_birth', 'gender', 'phone', 'address', 'department',
+                  'designation', 'qualification', 'joining_date', 'salary')
+        read_only_fields = fields
+
+
+class UserInlineSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """User fields embedded in student and staff details"""
+    full_name = serializers.CharField(read_only=True)
+    
+    class Meta:
+        model = User
+        fields = ('id', 'email', 'first_name', 'last_name', 'full_name', 'role', 'is_active')
+        read_only_fields = fields
+
+
+class UserSerializer(DynamicFieldsMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for user details"""
-    full_name = serializers.SerializerMethodField()
-    student_profile = serializers.SerializerMethodField()
-    staff_profile = serializers.SerializerMethodField()
+    full_name = serializers.CharField(read_only=True)
+    # allow_null renders a missing reverse one-to-one as null
+    student_profile = StudentProfileInlineSerializer(read_only=True, allow_null=True)
+    staff_profile = StaffProfileInlineSerializer(read_only=True, allow_null=True)
     
     class Meta:
         model = User
         fields = ('id', 'email', 'first_name', 'last_name', 'full_name', 
                   'role', 'date_joined', 'is_active', 'student_profile', 'staff_profile')
         read_only_fields = ('id', 'date_joined', 'is_active', 'role')
-    
-    def get_full_name(self, obj):
-        return obj.get_full_name()
-    
-    def get_student_profile(self, obj):
-        """Return student profile without circular reference"""
-        if hasattr(obj, 'student_profile'):
-            student = obj.student_profile
-            return {
-                'student_id': student.student_id,
-                'date_of_birth': student.date_of_birth,
-                'gender': student.gender,
-                'phone': student.phone,
-                'address': student.address,
-                'enrollment_date': student.enrollment_date,
-                'department': student.department,
-            }
-        return None
-    
-    def get_staff_profile(self, obj):
-        """Return staff profile without circular reference"""
-        if hasattr(obj, 'staff_profile'):
-            staff = obj.staff_profile
-            return {
-                'staff_id': staff.staff_id,
-                'date_of_birth': staff.date_of_birth,
-                'gender': staff.gender,
-                'phone': staff.phone,
-                'address': staff.address,
-                'department': staff.department,
-                'designation': staff.designation,
-                'qualification': staff.qualification,
-                'joining_date': staff.joining_date,
-                'salary': str(staff.salary) if staff.salary else None,
-            }
-        return None
 
 
-class StudentSerializer(serializers.ModelSerializer):
-    """Serializer for Student model"""
-    user = serializers.SerializerMethodField()
-    email = serializers.EmailField(write_only=True, required=False)
+class ProfileUserFieldsMixin(serializers.Serializer):
+    """Embedded user plus the write-only user fields shared by the student and staff serializers"""
+    user = UserInlineSerializer(read_only=True)
+    email = LowercaseEmailField(write_only=True, required=False)
     first_name = serializers.CharField(write_only=True, required=False)
     last_name = serializers.CharField(write_only=True, required=False)
-    user_email = serializers.EmailField(write_only=True, required=False)
+    user_email = LowercaseEmailField(write_only=True, required=False)
     user_first_name = serializers.CharField(write_only=True, required=False)
     user_last_name = serializers.CharField(write_only=True, required=False)
     
+    def _pop_user_data(self, validated_data):
+        """Extract email, first_name, last_name and their user_* aliases"""
+        return {
+            dst: validated_data.pop(src) for src, dst in USER_FIELD_MAP if src in validated_data
+        }
+    
+    def _update_user(self, instance, user_data):
+        """Write user data with one narrow UPDATE, then mirror it onto the loaded user"""
+        if not (user_data and instance.user_id):
+            return
+        User.objects.filter(pk=instance.user_id).update(**user_data)
+        user = instance.user
+        for key, value in user_data.items():
+            setattr(user, key, value)
+        # full_name is regenerated by the database; reload it on next access
+        user.__dict__.pop('full_name', None)
+        user._str_cache = None
+    
+    def _update_profile(self, instance, validated_data, optional_fields):
+        """
+        Write only the sent profile columns with one UPDATE, storing empty
+        strings as None for optional fields. Falls back to save() when a
+        save signal receiver is registered for the model.
+        """
+        clean_data = {
+            attr: None if value == '' and attr in optional_fields else value
+            for attr, value in validated_data.items()
+        }
+        for attr, value in clean_data.items():
+            setattr(instance, attr, value)
+        model = type(instance)
+        if pre_save.has_listeners(model) or post_save.has_listeners(model):
+            instance.save()
+            return
+        if clean_data:
+            model._base_manager.filter(pk=instance.pk).update(**clean_data)
+            # updated_at is bumped by the database; reload it on next access
+            instance.__dict__.pop('updated_at', None)
+
+
+class StudentSerializer(DynamicFieldsMixin, CachedFieldsMixin, ProfileUserFieldsMixin, serializers.ModelSerializer):
+    """Serializer for Student model"""
+    department = UppercaseChoiceField(
+        choices=Student.DEPARTMENT_CHOICES, required=False, allow_null=True, allow_blank=True
+    )
+    
     class Meta:
         model = Student
         fields = (
@@ -73,88 +182,25 @@ class StudentSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('user', 'enrollment_date', 'created_at', 'updated_at')
     
-    def get_user(self, obj):
-        """Return user details without circular reference"""
-        if obj.user:
-            return {
-                'id': obj.user.id,
-                'email': obj.user.email,
-                'first_name': obj.user.first_name,
-                'last_name': obj.user.last_name,
-                'full_name': obj.user.get_full_name(),
-                'role': obj.user.role,
-                'is_active': obj.user.is_active
-            }
-        return None
-    
     def update(self, instance, validated_data):
         """Update student and related user"""
-        # Handle user fields - extract email, first_name, last_name
-        user_data = {}
-        
-        # Check for direct email/first_name/last_name fields
-        if 'email' in validated_data:
-            user_data['email'] = validated_data.pop('email')
-        if 'first_name' in validated_data:
-            user_data['first_name'] = validated_data.pop('first_name')
-        if 'last_name' in validated_data:
-            user_data['last_name'] = validated_data.pop('last_name')
-        
-        # Check for user_email/user_first_name/user_last_name fields (backward compatibility)
-        if 'user_email' in validated_data:
-            user_data['email'] = validated_data.pop('user_email')
-        if 'user_first_name' in validated_data:
-            user_data['first_name'] = validated_data.pop('user_first_name')
-        if 'user_last_name' in validated_data:
-            user_data['last_name'] = validated_data.pop('user_last_name')
-        
-        # Handle department field specifically to ensure case sensitivity and validity
-        if 'department' in validated_data:
-            dept = validated_data['department']
-            if dept:
-                # Convert to uppercase to match choices
-                dept = dept.upper()
-                # Check if the department is in the valid choices
-                valid_departments = dict(instance.DEPARTMENT_CHOICES).keys()
-                if dept not in valid_departments:
-                    raise serializers.ValidationError({
-                        'department': f'"{dept}" is not a valid department. Must be one of: {list(valid_departments)}'
-                    })
-                validated_data['department'] = dept
+        user_data = self._pop_user_data(validated_data)
         
         # Update User model if user data is provided
-        if user_data and instance.user:
-            user = instance.user
-            for key, value in user_data.items():
-                if value or value == '':  # Update even if empty string (to allow clearing)
-                    setattr(user, key, value if value else '')
-            user.save()
+        self._update_user(instance, user_data)
         
         # Update Student model
-        for attr, value in validated_data.items():
-            # Skip empty strings for optional fields, convert to None
-            if value == '' and attr in ['date_of_birth', 'gender', 'phone', 'address', 'department']:
-                setattr(instance, attr, None)
-            else:
-                setattr(instance, attr, value)
-        
         try:
-            instance.save()
-        except Exception as e:
+            self._update_profile(instance, validated_data, STUDENT_OPTIONAL_FIELDS)
+        except IntegrityError as e:
             raise serializers.ValidationError(str(e))
         
         return instance
 
 
-class StaffSerializer(serializers.ModelSerializer):
+class StaffSerializer(DynamicFieldsMixin, CachedFieldsMixin, ProfileUserFieldsMixin, serializers.ModelSerializer):
     """Serializer for Staff model"""
-    user = serializers.SerializerMethodField()
-    email = serializers.EmailField(write_only=True, required=False)
-    first_name = serializers.CharField(write_only=True, required=False)
-    last_name = serializers.CharField(write_only=True, required=False)
-    user_email = serializers.EmailField(write_only=True, required=False)
-    user_first_name = serializers.CharField(write_only=True, required=False)
-    user_last_name = serializers.CharField(write_only=True, required=False)
+    salary = serializers.DecimalField(max_digits=10, decimal_places=2, required=False, allow_null=True)
     
     class Meta:
         model = Staff
@@ -167,68 +213,40 @@ class StaffSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('user', 'joining_date', 'created_at', 'updated_at')
     
-    def get_user(self, obj):
-        """Return user details without circular reference"""
-        if obj.user:
-            return {
-                'id': obj.user.id,
-                'email': obj.user.email,
-                'first_name': obj.user.first_name,
-                'last_name': obj.user.last_name,
-                'full_name': obj.user.get_full_name(),
-                'role': obj.user.role,
-                'is_active': obj.user.is_active  # Add this line
-            }
-        return None
-    
     def update(self, instance, validated_data):
         """Update staff and related user"""
-        # Handle user fields - extract email, first_name, last_name
-        user_data = {}
-        
-        # Check for direct email/first_name/last_name fields
-        if 'email' in validated_data:
-            user_data['email'] = validated_data.pop('email')
-        if 'first_name' in validated_data:
-            user_data['first_name'] = validated_data.pop('first_name')
-        if 'last_name' in validated_data:
-            user_data['last_name'] = validated_data.pop('last_name')
-        
-        # Check for user_email/user_first_name/user_last_name fields (backward compatibility)
-        if 'user_email' in validated_data:
-            user_data['email'] = validated_data.pop('user_email')
-        if 'user_first_name' in validated_data:
-            user_data['first_name'] = validated_data.pop('user_first_name')
-        if 'user_last_name' in validated_data:
-            user_data['last_name'] = validated_data.pop('user_last_name')
+        user_data = self._pop_user_data(validated_data)
         
         # Update User model if user data is provided
-        if user_data and instance.user:
-            user = instance.user
-            for key, value in user_data.items():
-                if value or value == '':  # Update even if empty string (to allow clearing)
-                    setattr(user, key, value if value else '')
-            user.save()
+        self._update_user(instance, user_data)
+        
+        # salary is stored as integer cents
+        if 'salary' in validated_data:
+            instance.salary = validated_data.pop('salary')
+            validated_data['salary_cents'] = instance.salary_cents
         
         # Update Staff model
-        for attr, value in validated_data.items():
-            # Skip empty strings for optional fields, convert to None
-            if value == '' and attr in ['date_of_birth', 'gender', 'phone', 'address', 'department', 
-                                      'designation', 'qualification', 'salary']:
-                setattr(instance, attr, None)
-            else:
-                setattr(instance, attr, value)
-        instance.save()
+        self._update_profile(instance, validated_data, STAFF_OPTIONAL_FIELDS)
         
         return instance
 
 
+def taken_registration_fields(email, profile_model, id_field, id_value):
+    """
+    Return which of 'email' / id_field are already in use, checking both
+    unique indexes in a single UNION ALL query
+    """
+    taken_email = User.objects.filter(email=email).values_list(Value('email'))
+    taken_id = profile_model.objects.filter(**{id_field: id_value}).values_list(Value(id_field))
+    return {name for (name,) in taken_email.union(taken_id, all=True)}
+
+
 class StudentRegistrationSerializer(serializers.Serializer):
     """Serializer for creating a student with user account"""
     # User fields
-    email = serializers.EmailField(required=True)
-    first_name = serializers.CharField(required=True, max_length=100)
-    last_name = serializers.CharField(required=True, max_length=100)
+    email = LowercaseEmailField(required=True)
+    first_name = serializers.CharField(required=True, max_length=50)
+    last_name = serializers.CharField(required=True, max_length=50)
     password = serializers.CharField(
         write_only=True,
         required=True,
@@ -255,25 +273,29 @@ class StudentRegistrationSerializer(serializers.Serializer):
                 {"password": "Password fields didn't match."}
             )
         
-        # Check if email already exists
-        if User.objects.filter(email=attrs['email']).exists():
+        # Check email and student_id uniqueness in one round-trip
+        taken = taken_registration_fields(attrs['email'], Student, 'student_id', attrs['student_id'])
+        if 'email' in taken:
             raise serializers.ValidationError(
                 {"email": "A user with this email already exists."}
             )
         
-        # Check if student_id already exists
-        if Student.objects.filter(student_id=attrs['student_id']).exists():
+        if 'student_id' in taken:
             raise serializers.ValidationError(
                 {"student_id": "A student with this ID already exists."}
             )
         
         # Convert empty strings to None for optional fields
-        for field in ['date_of_birth', 'gender', 'phone', 'address', 'department']:
+        for field in STUDENT_OPTIONAL_FIELDS:
             if field in attrs and attrs[field] == '':
                 attrs[field] = None
         
         return attrs
     
+    # Validated fields that belong to the Student row rather than the User
+    PROFILE_FIELDS = ('student_id', 'date_of_birth', 'gender', 'phone', 'address', 'department')
+    
+    @transaction.atomic
     def create(self, validated_data):
         """Create a new student with user account"""
         password = validated_data.pop('password')
@@ -290,7 +312,7 @@ class StudentRegistrationSerializer(serializers.Serializer):
         # Create user
         user = User.objects.create_user(
             password=password,
-            role='student',
+            role=Role.STUDENT,
             **validated_data
         )
         
@@ -306,14 +328,31 @@ class StudentRegistrationSerializer(serializers.Serializer):
         )
         
         return student
+    
+    @classmethod
+    @transaction.atomic
+    def bulk_create(cls, validated_list):
+        """Create students and their user accounts from validated_data dicts in batched INSERTs"""
+        records = []
+        profiles = []
+        for data in validated_list:
+            data = dict(data)
+            data.pop('password2', None)
+            profiles.append({field: data.pop(field, None) for field in cls.PROFILE_FIELDS})
+            records.append({**data, 'role': Role.STUDENT})
+        
+        users = User.objects.bulk_create_users(records)
+        return Student.objects.bulk_create([
+            Student(user=user, **profile) for user, profile in zip(users, profiles)
+        ])
 
 
 class StaffRegistrationSerializer(serializers.Serializer):
     """Serializer for creating a staff member with user account"""
     # User fields
-    email = serializers.EmailField(required=True)
-    first_name = serializers.CharField(required=True, max_length=100)
-    last_name = serializers.CharField(required=True, max_length=100)
+    email = LowercaseEmailField(required=True)
+    first_name = serializers.CharField(required=True, max_length=50)
+    last_name = serializers.CharField(required=True, max_length=50)
     password = serializers.CharField(
         write_only=True,
         required=True,
@@ -332,8 +371,8 @@ class StaffRegistrationSerializer(serializers.Serializer):
     phone = serializers.CharField(required=False, allow_null=True, allow_blank=True, max_length=15)
     address = serializers.CharField(required=False, allow_null=True, allow_blank=True)
     department = serializers.ChoiceField(choices=Staff.DEPARTMENT_CHOICES, required=False, allow_null=True)
-    designation = serializers.CharField(required=False, allow_null=True, allow_blank=True, max_length=100)
-    qualification = serializers.CharField(required=False, allow_null=True, allow_blank=True, max_length=200)
+    designation = serializers.CharField(required=False, allow_null=True, allow_blank=True, max_length=60)
+    qualification = serializers.CharField(required=False, allow_null=True, allow_blank=True, max_length=120)
     salary = serializers.DecimalField(required=False, allow_null=True, max_digits=10, decimal_places=2)
     
     def validate(self, attrs):
@@ -343,26 +382,32 @@ class StaffRegistrationSerializer(serializers.Serializer):
                 {"password": "Password fields didn't match."}
             )
         
-        # Check if email already exists
-        if User.objects.filter(email=attrs['email']).exists():
+        # Check email and staff_id uniqueness in one round-trip
+        taken = taken_registration_fields(attrs['email'], Staff, 'staff_id', attrs['staff_id'])
+        if 'email' in taken:
             raise serializers.ValidationError(
                 {"email": "A user with this email already exists."}
             )
         
-        # Check if staff_id already exists
-        if Staff.objects.filter(staff_id=attrs['staff_id']).exists():
+        if 'staff_id' in taken:
             raise serializers.ValidationError(
                 {"staff_id": "A staff member with this ID already exists."}
             )
         
         # Convert empty strings to None for optional fields
-        for field in ['date_of_birth', 'gender', 'phone', 'address', 'department', 
-                     'designation', 'qualification', 'salary']:
+        for field in STAFF_OPTIONAL_FIELDS:
             if field in attrs and attrs[field] == '':
                 attrs[field] = None
         
         return attrs
     
+    # Validated fields that belong to the Staff row rather than the User
+    PROFILE_FIELDS = (
+        'staff_id', 'date_of_birth', 'gender', 'phone', 'address', 'department',
+        'designation', 'qualification', 'salary'
+    )
+    
+    @transaction.atomic
     def create(self, validated_data):
         """Create a new staff member with user account"""
         password = validated_data.pop('password')
@@ -382,7 +427,7 @@ class StaffRegistrationSerializer(serializers.Serializer):
         # Create user
         user = User.objects.create_user(
             password=password,
-            role='staff',
+            role=Role.STAFF,
             is_staff=True,
             **validated_data
         )
@@ -402,10 +447,31 @@ class StaffRegistrationSerializer(serializers.Serializer):
         )
         
         return staff
+    
+    @classmethod
+    @transaction.atomic
+    def bulk_create(cls, validated_list):
+        """Create staff members and their user accounts from validated_data dicts in batched INSERTs"""
+        records = []
+        profiles = []
+        for data in validated_list:
+            data = dict(data)
+            data.pop('password2', None)
+            profiles.append({field: data.pop(field, None) for field in cls.PROFILE_FIELDS})
+            records.append({**data, 'role': Role.STAFF, 'is_staff': True})
+        
+        users = User.objects.bulk_create_users(records)
+        return Staff.objects.bulk_create([
+            Staff(user=user, **profile) for user, profile in zip(users, profiles)
+        ])
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """Serializer for basic user registration (admin only)"""
+    email = LowercaseEmailField(
+        required=True,
+        validators=[UniqueValidator(queryset=User.objects.all(), message='User with this email already exists.')]
+    )
     password = serializers.CharField(
         write_only=True,
         required=True,
@@ -421,7 +487,6 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         model = User
         fields = ('email', 'first_name', 'last_name', 'role', 'password', 'password2')
         extra_kwargs = {
-            'email': {'required': True},
             'first_name': {'required': True},
             'last_name': {'required': True},
             'role': {'required': True},
@@ -442,7 +507,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         password = validated_data.pop('password')
         
         # Set is_staff based on role
-        if validated_data.get('role') in ['admin', 'staff']:
+        if validated_data.get('role') in (Role.ADMIN, Role.STAFF):
             validated_data['is_staff'] = True
         
         user = User.objects.create_user(
@@ -454,15 +519,15 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
 class LoginSerializer(serializers.Serializer):
     """Serializer for user login"""
-    email = serializers.EmailField(required=True)
+    email = LowercaseEmailField(required=True)
     password = serializers.CharField(required=True, write_only=True)
 
 
-class HeadOfDepartmentSerializer(serializers.ModelSerializer):
+class HeadOfDepartmentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Head of Department model"""
     staff_id = serializers.CharField(source='staff.staff_id', read_only=True)
-    staff_name = serializers.SerializerMethodField()
-    department_name = serializers.SerializerMethodField()
+    staff_name = serializers.CharField(source='staff.user.full_name', read_only=True)
+    department_name = serializers.CharField(source='get_department_display', read_only=True)
     
     class Meta:
         model = HeadOfDepartment
@@ -473,14 +538,6 @@ class HeadOfDepartmentSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'created_at', 'updated_at', 'staff_id', 'staff_name', 'department_name')
     
-    def get_staff_name(self, obj):
-        """Get the full name of the staff member"""
-        return obj.staff.user.get_full_name()
-    
-    def get_department_name(self, obj):
-        """Get the display name of the department"""
-        return obj.get_department_display()
-    
     def validate(self, attrs):
         """Validate the HOD appointment"""
         staff = attrs.get('staff')
@@ -490,23 +547,22 @@ class HeadOfDepartmentSerializer(serializers.ModelSerializer):
         if not staff.user.is_active:
             raise serializers.ValidationError("Cannot assign an inactive staff member as HOD.")
         
-        # Check if staff is already HOD of another department
-        existing_hod = HeadOfDepartment.objects.filter(
-            staff=staff,
+        # Fetch active HODs clashing on either the staff member or the department
+        # in one query; at most one row can match each side
+        conflicts = list(HeadOfDepartment.objects.filter(
+            Q(staff=staff) | Q(department=department),
             is_active=True
-        ).exclude(pk=self.instance.pk if self.instance else None).first()
+        ).exclude(pk=self.instance.pk if self.instance else None)[:2])
         
+        # Check if staff is already HOD of another department
+        existing_hod = next((hod for hod in conflicts if hod.staff_id == staff.pk), None)
         if existing_hod:
             raise serializers.ValidationError(
                 f"This staff member is already the HOD of {existing_hod.get_department_display()} department."
             )
         
         # Check if there's already an active HOD for this department
-        existing_dept_hod = HeadOfDepartment.objects.filter(
-            department=department,
-            is_active=True
-        ).exclude(pk=self.instance.pk if self.instance else None).first()
-        
+        existing_dept_hod = next((hod for hod in conflicts if hod.department == department), None)
         if existing_dept_hod:
             raise serializers.ValidationError(
                 f"{existing_dept_hod.staff.user.get_full_name()} is already the HOD of {existing_dept_hod.get_department_display()} department."
@@ -516,15 +572,12 @@ class HeadOfDepartmentSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         """Create a new HOD appointment"""
-        # End any existing active HOD for this department
-        HeadOfDepartment.objects.filter(
-            department=validated_data['department'],
-            is_active=True
-        ).update(is_active=False, end_date=timezone.now().date())
+        # validate() has already rejected departments with an active HOD, and
+        # HeadOfDepartment.save() ends any term that slipped in since
         
         # Set start date to current date if not provided
         if 'start_date' not in validated_data:
-            validated_data['start_date'] = timezone.now().date()
+            validated_data['start_date'] = timezone.localdate()
             
         # Create new HOD appointment
         return super().create(validated_data)
@@ -533,12 +586,19 @@ class HeadOfDepartmentSerializer(serializers.ModelSerializer):
         """Update HOD appointment"""
         # If department is being changed, end the current HOD's term
         if 'department' in validated_data and instance.department != validated_data['department']:
-            instance.end_date = timezone.now().date()
+            instance.end_date = timezone.localdate()
             instance.is_active = False
-            instance.save()
+            instance.save(update_fields=['end_date', 'is_active'])
             
             # Create a new HOD record for the new department
             validated_data.pop('start_date', None)  # Use current date for new appointment
             return super().create(validated_data)
-            
-        return super().update(instance, validated_data)
+        
+        # Only write the sent columns; save() fills in end_date on deactivation
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        update_fields = set(validated_data)
+        if not instance.is_active:
+            update_fields.add('end_date')
+        instance.save(update_fields=update_fields)
+        return instance
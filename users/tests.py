@@ -1,3 +1,287 @@
-from django.test import TestCase
+import datetime
+import unittest
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.test import APITestCase
+
+from .authentication import auth_user_key
+from .models import User, Student, Staff, HeadOfDepartment, Role
+from .views import issue_tokens
+
+
+def make_user(email, role=Role.STUDENT, **extra_fields):
+    return User.objects.create_user(
+        email=email, password='pass12345', first_name='Test', last_name='User',
+        role=role, **extra_fields
+    )
+
+
+def make_staff(staff_id, **extra_fields):
+    user = make_user(f'{staff_id.lower()}@example.com', Role.STAFF)
+    return Staff.objects.create(user=user, staff_id=staff_id, **extra_fields)
+
+
+class APITestBase(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.admin = make_user('admin@example.com', Role.ADMIN, is_staff=True)
+
+
+class HeadOfDepartmentTenureTests(APITestBase):
+    """The HOD list can be sorted by tenure computed in the database"""
+
+    def setUp(self):
+        super().setUp()
+        today = datetime.date.today()
+        self.short = HeadOfDepartment.objects.create(
+            staff=make_staff('ST1'), department='IT', start_date=today - datetime.timedelta(days=10)
+        )
+        self.long = HeadOfDepartment.objects.create(
+            staff=make_staff('ST2'), department='CS',
+            start_date=today - datetime.timedelta(days=400), end_date=today - datetime.timedelta(days=100),
+            is_active=False
+        )
+
+    def test_with_duration_matches_property(self):
+        for hod in HeadOfDepartment.objects.with_duration():
+            self.assertEqual(hod.duration, HeadOfDepartment.objects.get(pk=hod.pk).duration)
+        self.assertEqual(HeadOfDepartment.objects.with_duration().get(pk=self.long.pk).duration, 300)
+
+    def test_list_ordered_by_duration(self):
+        self.client.force_authenticate(self.admin)
+        for ordering, expected in (('duration', [self.short.id, self.long.id]),
+                                   ('-duration', [self.long.id, self.short.id])):
+            response = self.client.get('/api/auth/hods/', {'ordering': ordering})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual([hod['id'] for hod in response.data['results']], expected)
+
+
+class StaffSalaryTests(APITestBase):
+    """Salary is stored as integer cents and read back as a two-place Decimal"""
+
+    def test_property_round_trip(self):
+        staff = make_staff('ST1', salary_cents=None)
+        self.assertIsNone(staff.salary)
+        staff.salary = Decimal('45250.75')
+        staff.save()
+        staff.refresh_from_db()
+        self.assertEqual(staff.salary_cents, 4525075)
+        self.assertEqual(staff.salary, Decimal('45250.75'))
+
+    def test_patch_salary(self):
+        make_staff('ST1')
+        self.client.force_authenticate(self.admin)
+        response = self.client.patch('/api/auth/staff/ST1/', {'salary': '1234.56'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['staff']['salary'], '1234.56')
+        self.assertEqual(Staff.objects.get(staff_id='ST1').salary_cents, 123456)
+
+
+class DatabaseTimestampTests(APITestBase):
+    """created_at/updated_at/date_joined are stamped by their db_default"""
+
+    def test_create_stamps_timestamps(self):
+        staff = make_staff('ST1')
+        staff.refresh_from_db()
+        staff.user.refresh_from_db()
+        self.assertIsNotNone(staff.created_at)
+        self.assertIsNotNone(staff.updated_at)
+        self.assertIsNotNone(staff.joining_date)
+        self.assertIsNotNone(staff.user.date_joined)
+
+    def test_update_response_includes_timestamps(self):
+        make_staff('ST1')
+        self.client.force_authenticate(self.admin)
+        response = self.client.patch('/api/auth/staff/ST1/', {'designation': 'Professor'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.data['staff']['created_at'])
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'role triggers are PostgreSQL-only (migration 0010)')
+class RoleSyncTriggerTests(APITestBase):
+    """Profile inserts set the user's role in the database, including bulk_create"""
+
+    def test_student_insert_sets_role(self):
+        user = make_user('s1@example.com', Role.STAFF)
+        Student.objects.create(user=user, student_id='S1')
+        user.refresh_from_db()
+        self.assertEqual(user.role, Role.STUDENT)
+
+    def test_bulk_created_students_set_role(self):
+        users = [make_user(f's{i}@example.com', Role.STAFF) for i in range(3)]
+        Student.objects.bulk_create(Student(user=user, student_id=f'S{i}') for i, user in enumerate(users))
+        self.assertFalse(User.objects.filter(pk__in=[u.pk for u in users]).exclude(role=Role.STUDENT).exists())
+
+    def test_hod_insert_sets_staff_role(self):
+        staff = make_staff('ST1')
+        User.objects.filter(pk=staff.pk).update(role=Role.STUDENT)
+        HeadOfDepartment.objects.create(staff=staff, department='IT', start_date=datetime.date.today())
+        self.assertEqual(User.objects.get(pk=staff.pk).role, Role.STAFF)
+
+
+class RosterConditionalGetTests(APITestBase):
+    """Student/staff lists answer a matching If-None-Match with 304"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.admin)
+        Student.objects.create(user=make_user('s1@example.com'), student_id='S1')
+
+    def test_repeat_poll_not_modified(self):
+        for url in ('/api/auth/students/', '/api/auth/students/?lite=1', '/api/auth/staff/'):
+            etag = self.client.get(url)['ETag']
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response['ETag'], etag)
+
+    def test_lite_and_full_lists_have_distinct_etags(self):
+        self.assertNotEqual(
+            self.client.get('/api/auth/students/')['ETag'],
+            self.client.get('/api/auth/students/?lite=1')['ETag']
+        )
+
+    def test_insert_and_delete_change_etag(self):
+        etag = self.client.get('/api/auth/students/')['ETag']
+        Student.objects.create(user=make_user('s2@example.com'), student_id='S2')
+        response = self.client.get('/api/auth/students/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        self.assertEqual(self.client.delete('/api/auth/students/S2/').status_code, 204)
+        response = self.client.get('/api/auth/students/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['students']), 1)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'updated_at is bumped by a PostgreSQL trigger (migration 0006)')
+    def test_update_changes_etag(self):
+        etag = self.client.get('/api/auth/students/')['ETag']
+        self.assertEqual(self.client.patch('/api/auth/students/S1/', {'phone': '5551234567'}, format='json').status_code, 200)
+        response = self.client.get('/api/auth/students/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class AuthUserCacheTests(APITestBase):
+    """Token users are cached between requests and forgotten when their rows change"""
+
+    def setUp(self):
+        super().setUp()
+        self.student = Student.objects.create(user=make_user('s1@example.com'), student_id='S1')
+
+    def request(self, user, method, url, **kwargs):
+        token = issue_tokens(user)['access']
+        return getattr(self.client, method)(url, HTTP_AUTHORIZATION=f'Bearer {token}', format='json', **kwargs)
+
+    def profile(self):
+        return self.request(self.student.user, 'get', '/api/auth/profile/')
+
+    def test_repeat_request_skips_user_select(self):
+        self.assertEqual(self.profile().status_code, 200)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.profile().status_code, 200)
+
+    def test_update_forgets_cached_user(self):
+        self.profile()
+        self.assertIsNotNone(cache.get(auth_user_key(self.student.pk)))
+        response = self.request(self.admin, 'patch', '/api/auth/students/S1/', data={'phone': '5551234567'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(cache.get(auth_user_key(self.student.pk)))
+        self.assertIsNone(cache.get(f'user:ser:{self.student.pk}'))
+        self.assertEqual(self.profile().data['student_profile']['phone'], '5551234567')
+
+    def test_delete_revokes_cached_user(self):
+        self.profile()
+        self.assertEqual(self.request(self.admin, 'delete', '/api/auth/students/S1/').status_code, 204)
+        self.assertEqual(self.profile().status_code, 401)
+
+
+class RolePermissionTests(APITestBase):
+    """IsAdmin/IsAdminOrStaff check the role, not the is_staff flag"""
+
+    def setUp(self):
+        super().setUp()
+        self.student = make_user('s1@example.com')
+        self.staff = make_staff('ST1').user
+
+    def test_student_token_denied(self):
+        token = issue_tokens(self.student)['access']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        for method, url in (('get', '/api/auth/students/'), ('get', '/api/auth/staff/'),
+                            ('get', '/api/auth/hods/'), ('post', '/api/auth/add-staff/'),
+                            ('post', '/api/auth/add-student/')):
+            response = getattr(self.client, method)(url, {}, format='json')
+            self.assertEqual(response.status_code, 403, url)
+
+    def test_staff_limited_to_admin_or_staff_views(self):
+        self.client.force_authenticate(self.staff)
+        self.assertEqual(self.client.get('/api/auth/students/').status_code, 403)
+        # Reaches the serializer, so the permission passed
+        self.assertEqual(self.client.post('/api/auth/add-student/', {}, format='json').status_code, 400)
+
+    def test_is_staff_flag_alone_is_not_admin(self):
+        self.student.is_staff = True
+        self.student.save()
+        self.client.force_authenticate(self.student)
+        self.assertEqual(self.client.get('/api/auth/students/').status_code, 403)
+
+    def test_anonymous_denied(self):
+        self.assertEqual(self.client.get('/api/auth/students/').status_code, 401)
+
+
+class ProfileConditionalGetTests(APITestBase):
+    """Profile and department-HOD responses carry a content ETag and answer repeats with 304"""
+
+    def setUp(self):
+        super().setUp()
+        self.student = Student.objects.create(user=make_user('s1@example.com'), student_id='S1')
+        self.hod = HeadOfDepartment.objects.create(
+            staff=make_staff('ST1'), department='IT', start_date=datetime.date.today()
+        )
+
+    def request(self, user, method, url, **kwargs):
+        # Real tokens, so the request user comes through CachedJWTAuthentication
+        token = issue_tokens(user)['access']
+        return getattr(self.client, method)(url, HTTP_AUTHORIZATION=f'Bearer {token}', format='json', **kwargs)
+
+    def assert_write_refreshes_etag(self, url, write_url, data):
+        etag = self.request(self.student.user, 'get', url)['ETag']
+        response = self.request(self.student.user, 'get', url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        self.assertEqual(self.request(self.admin, 'patch', write_url, data=data).status_code, 200)
+        response = self.request(self.student.user, 'get', url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_profile(self):
+        self.assert_write_refreshes_etag(
+            '/api/auth/profile/', '/api/auth/students/S1/', {'phone': '5551234567'}
+        )
+
+    def test_department_hod(self):
+        self.assert_write_refreshes_etag(
+            '/api/auth/departments/IT/hod/', f'/api/auth/hods/{self.hod.id}/',
+            {'staff': self.hod.staff_id, 'department': 'IT', 'additional_responsibilities': 'Timetable'}
+        )
+
+
+class UserFullNameTests(APITestBase):
+    """get_full_name() follows the name fields; full_name is the stored column"""
+
+    def test_unsaved_user(self):
+        self.assertEqual(User(first_name='Ada', last_name='Lovelace').get_full_name(), 'Ada Lovelace')
+
+    def test_in_memory_edit(self):
+        user = make_user('s1@example.com')
+        user.first_name = 'Ada'
+        self.assertEqual(user.get_full_name(), 'Ada User')
+
+    def test_projection_without_name_fields(self):
+        make_user('s1@example.com')
+        user = User.objects.only('full_name').get(email='s1@example.com')
+        with self.assertNumQueries(0):
+            self.assertEqual(user.get_full_name(), 'Test User')
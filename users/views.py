@@ -1,23 +1,108 @@
 from rest_framework import status, generics, permissions
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.views import APIView
+from django.core.cache import cache
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
 from django.contrib.auth import authenticate
+from django.db import transaction
+from django.db.models import Count, F, Max
+from django.shortcuts import get_object_or_404
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+import hashlib
+import json
 import logging
 from .serializers import (
     UserRegistrationSerializer, UserSerializer, LoginSerializer,
     StudentRegistrationSerializer, StaffRegistrationSerializer,
-    StudentSerializer, StaffSerializer, HeadOfDepartmentSerializer
+    StudentSerializer, StaffSerializer, HeadOfDepartmentSerializer, requested_fields
 )
+from .authentication import auth_user_key
+from .permissions import IsAdmin, IsAdminOrStaff
 from .models import User, Student, Staff, HeadOfDepartment
 
 logger = logging.getLogger(__name__)
 
+# Flat columns returned by ?lite=1 list requests, read with values()
+STUDENT_LITE_FIELDS = ('student_id', 'department')
+STAFF_LITE_FIELDS = ('staff_id', 'department', 'designation')
+LITE_USER_FIELDS = {'email': F('user__email'), 'full_name': F('user__full_name')}
+
+# User columns login_view reads before the credentials are accepted
+LOGIN_USER_FIELDS = ('id', 'email', 'password', 'is_active', 'role')
+
+# Seconds a serialized user is reused by login/profile responses. The default
+# cache is per-process, so edits made elsewhere show up within this window
+USER_DATA_TTL = 60
+
+
+def _user_data_key(user_id):
+    return f'user:ser:{user_id}'
+
+
+def cached_user_data(user, reload=False):
+    """
+    UserSerializer(user).data, reused from the cache for USER_DATA_TTL seconds.
+    With reload, a miss re-reads the user and profiles first, for callers
+    holding a partially loaded user.
+    """
+    key = _user_data_key(user.pk)
+    data = cache.get(key)
+    if data is None:
+        if reload:
+            user = User.objects.select_related('student_profile', 'staff_profile').get(pk=user.pk)
+        data = UserSerializer(user).data
+        cache.set(key, data, USER_DATA_TTL)
+    return data
+
+
+def issue_tokens(user):
+    """
+    A refresh/access token pair for user. SimpleJWT's module-level token
+    backend already holds the signing key, so each token is signed once.
+    """
+    refresh = RefreshToken.for_user(user)
+    return {
+        'refresh': str(refresh),
+        'access': str(refresh.access_token),
+    }
+
+
+def forget_user_data(user_id):
+    """Drop a user's cached serialization and auth user after their user or profile row changes"""
+    cache.delete_many([_user_data_key(user_id), auth_user_key(user_id)])
+
+
+def roster_etag(model, fields, lite=False):
+    """
+    Row count and ETag for a student/staff list. Any insert, delete or update
+    of a profile or its user moves the count or one of the MAX(updated_at)s.
+    """
+    agg = model.objects.aggregate(
+        count=Count('pk'), changed=Max('updated_at'), user_changed=Max('user__updated_at')
+    )
+    fingerprint = f"{agg['count']}:{agg['changed']}:{agg['user_changed']}:{sorted(fields or ())}:{lite}"
+    return agg['count'], '"%s"' % hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+
+
+def conditional_response(request, data):
+    """
+    200 Response for data carrying an ETag of its JSON, or 304 Not Modified
+    without a body when the client's If-None-Match already matches
+    """
+    payload = json.dumps(data, cls=JSONEncoder, sort_keys=True)
+    etag = '"%s"' % hashlib.md5(payload.encode(), usedforsecurity=False).hexdigest()
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = Response(data, status=status.HTTP_200_OK)
+    response['ETag'] = etag
+    return response
+
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
@@ -43,16 +128,10 @@ def register_view(request):
         
         user = serializer.save()
         
-        # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
-        
         return Response({
             'message': 'User registered successfully',
-            'user': UserSerializer(user).data,
-            'tokens': {
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
-            }
+            'user': cached_user_data(user),
+            'tokens': issue_tokens(user)
         }, status=status.HTTP_201_CREATED)
     
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -65,23 +144,25 @@ def login_view(request):
     Login user and return JWT tokens
     POST /api/auth/login/
     """
-    logger.info("Login attempt")
+    logger.debug("Login attempt")
     
     serializer = LoginSerializer(data=request.data)
     
     if not serializer.is_valid():
-        logger.warning(f"Serializer validation failed: {serializer.errors}")
+        logger.warning("Serializer validation failed: %s", serializer.errors)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     email = serializer.validated_data['email']
     password = serializer.validated_data['password']
     
-    logger.info("Processing login attempt")
+    logger.debug("Processing login attempt")
     
     # Try to get user by email first
     try:
-        user = User.objects.get(email=email)
-        logger.info("User found during login")
+        # Only what the password check and token need; the response body
+        # normally comes from the cache
+        user = User.objects.only(*LOGIN_USER_FIELDS).get(email=email)
+        logger.debug("User found during login")
     except User.DoesNotExist:
         logger.warning("User not found during login")
         return Response(
@@ -105,17 +186,12 @@ def login_view(request):
             status=status.HTTP_401_UNAUTHORIZED
         )
     
-    # Password is correct, generate JWT tokens
+    # Password is correct, respond with JWT tokens
     logger.info("Login successful")
-    refresh = RefreshToken.for_user(user)
-    
     return Response({
         'message': 'Login successful',
-        'user': UserSerializer(user).data,
-        'tokens': {
-            'refresh': str(refresh),
-            'access': str(refresh.access_token),
-        }
+        'user': cached_user_data(user, reload=True),
+        'tokens': issue_tokens(user)
     }, status=status.HTTP_200_OK)
 
 
@@ -126,29 +202,25 @@ def user_profile_view(request):
     Get current user profile
     GET /api/auth/profile/
     """
-    serializer = UserSerializer(request.user)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    # ?fields= trims the output, so only the full representation is cached
+    if requested_fields(request) is None:
+        return conditional_response(request, cached_user_data(request.user))
+    serializer = UserSerializer(request.user, context={'request': request})
+    return conditional_response(request, serializer.data)
 
 
 @api_view(['POST'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAdminOrStaff])
 def add_student_view(request):
     """
     Add a new student (Admin and Staff only)
     POST /api/auth/add-student/
     """
-    # Check if user has permission (admin or staff)
-    if request.user.role not in ['admin', 'staff']:
-        return Response(
-            {'error': 'You do not have permission to add students.'},
-            status=status.HTTP_403_FORBIDDEN
-        )
-    
-    logger.info("Processing add student request")
+    logger.debug("Processing add student request")
     serializer = StudentRegistrationSerializer(data=request.data)
     
     if not serializer.is_valid():
-        logger.warning(f"Serializer validation failed: {serializer.errors}")
+        logger.warning("Serializer validation failed: %s", serializer.errors)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     try:
@@ -167,24 +239,17 @@ def add_student_view(request):
 
 
 @api_view(['POST'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAdmin])
 def add_staff_view(request):
     """
     Add a new staff member (Admin only)
     POST /api/auth/add-staff/
     """
-    # Check if user has permission (admin only)
-    if request.user.role != 'admin':
-        return Response(
-            {'error': 'Only admins can add staff members.'},
-            status=status.HTTP_403_FORBIDDEN
-        )
-    
-    logger.info("Processing add staff request")
+    logger.debug("Processing add staff request")
     serializer = StaffRegistrationSerializer(data=request.data)
     
     if not serializer.is_valid():
-        logger.warning(f"Serializer validation failed: {serializer.errors}")
+        logger.warning("Serializer validation failed: %s", serializer.errors)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     try:
@@ -202,71 +267,82 @@ def add_staff_view(request):
         )
 
 @api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAdmin])
 def list_students_view(request):
     """
     List all students (Admin only)
     GET /api/auth/students/
+    GET /api/auth/students/?fields=student_id,user
+    GET /api/auth/students/?lite=1
     """
-    # Check if user has permission (admin only)
-    if request.user.role != 'admin':
-        return Response(
-            {'error': 'Only admins can view all students.'},
-            status=status.HTTP_403_FORBIDDEN
-        )
+    fields = requested_fields(request)
+    lite = request.query_params.get('lite') == '1'
     
-    students = Student.objects.all().order_by('-user__date_joined')
-    serializer = StudentSerializer(students, many=True)
-    return Response({
-        'count': students.count(),
-        'students': serializer.data
+    # Answer 304 Not Modified to pollers whose copy is still current
+    count, etag = roster_etag(Student, fields, lite)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        return not_modified
+    
+    if lite:
+        # Flat rows straight from one SELECT, skipping the serializer
+        data = list(Student.objects.order_by('-user__date_joined').values(*STUDENT_LITE_FIELDS, **LITE_USER_FIELDS))
+    else:
+        # ?fields= narrows both the rendered keys and the loaded columns
+        students = Student.objects.for_list(fields).order_by('-user__date_joined')
+        data = StudentSerializer(students, many=True, context={'request': request}).data
+    response = Response({
+        'count': count,
+        'students': data
     }, status=status.HTTP_200_OK)
+    response['ETag'] = etag
+    return response
 
 
 @api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAdmin])
 def list_staff_view(request):
     """
     List all staff members (Admin only)
     GET /api/auth/staff/
+    GET /api/auth/staff/?fields=staff_id,salary
+    GET /api/auth/staff/?lite=1
     """
-    # Check if user has permission (admin only)
-    if request.user.role != 'admin':
-        return Response(
-            {'error': 'Only admins can view all staff members.'},
-            status=status.HTTP_403_FORBIDDEN
-        )
+    fields = requested_fields(request)
+    lite = request.query_params.get('lite') == '1'
     
-    staff_members = Staff.objects.all().order_by('-user__date_joined')
-    serializer = StaffSerializer(staff_members, many=True)
-    return Response({
-        'count': staff_members.count(),
-        'staff': serializer.data
+    # Answer 304 Not Modified to pollers whose copy is still current
+    count, etag = roster_etag(Staff, fields, lite)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        return not_modified
+    
+    if lite:
+        # Flat rows straight from one SELECT, skipping the serializer
+        data = list(Staff.objects.order_by('-user__date_joined').values(*STAFF_LITE_FIELDS, **LITE_USER_FIELDS))
+    else:
+        # ?fields= narrows both the rendered keys and the loaded columns
+        staff_members = Staff.objects.for_list(fields).order_by('-user__date_joined')
+        data = StaffSerializer(staff_members, many=True, context={'request': request}).data
+    response = Response({
+        'count': count,
+        'staff': data
     }, status=status.HTTP_200_OK)
+    response['ETag'] = etag
+    return response
 
 
 @api_view(['PUT', 'PATCH', 'DELETE'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAdmin])
 def manage_student_view(request, student_id):
     """
     Update or delete a student (Admin only)
     PUT/PATCH /api/auth/students/<student_id>/
     DELETE /api/auth/students/<student_id>/
     """
-    # Check if user has permission (admin only)
-    if request.user.role != 'admin':
-        return Response(
-            {'error': 'Only admins can manage students.'},
-            status=status.HTTP_403_FORBIDDEN
-        )
-    
-    try:
-        student = Student.objects.get(student_id=student_id)
-    except Student.DoesNotExist:
-        return Response(
-            {'error': 'Student not found.'},
-            status=status.HTTP_404_NOT_FOUND
-        )
+    student = get_object_or_404(Student, student_id=student_id)
     
     if request.method in ['PUT', 'PATCH']:
         # For partial updates, use partial=True
@@ -286,9 +362,10 @@ def manage_student_view(request, student_id):
         
         try:
             updated_student = serializer.save()
+            forget_user_data(updated_student.pk)
             return Response({
                 'message': 'Student updated successfully',
-                'student': StudentSerializer(updated_student).data
+                'student': serializer.data
             }, status=status.HTTP_200_OK)
         except Exception as e:
             return Response(
@@ -298,10 +375,11 @@ def manage_student_view(request, student_id):
     
     elif request.method == 'DELETE':
         try:
-            # Delete the associated user
-            user = student.user
-            student.delete()
-            user.delete()
+            # Deleting the user cascades to the profile; one transaction so
+            # a failure can't leave either row behind
+            with transaction.atomic():
+                student.user.delete()
+            forget_user_data(student.pk)
             return Response(
                 {'message': 'Student deleted successfully'},
                 status=status.HTTP_204_NO_CONTENT
@@ -313,27 +391,14 @@ def manage_student_view(request, student_id):
             )
 
 @api_view(['PUT', 'PATCH', 'DELETE'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAdmin])
 def manage_staff_view(request, staff_id):
     """
     Update or delete a staff member (Admin only)
     PUT/PATCH /api/auth/staff/<staff_id>/
     DELETE /api/auth/staff/<staff_id>/
     """
-    # Check if user has permission (admin only)
-    if request.user.role != 'admin':
-        return Response(
-            {'error': 'Only admins can manage staff members.'},
-            status=status.HTTP_403_FORBIDDEN
-        )
-    
-    try:
-        staff = Staff.objects.get(staff_id=staff_id)
-    except Staff.DoesNotExist:
-        return Response(
-            {'error': 'Staff member not found.'},
-            status=status.HTTP_404_NOT_FOUND
-        )
+    staff = get_object_or_404(Staff, staff_id=staff_id)
     
     if request.method in ['PUT', 'PATCH']:
         # For partial updates, use partial=True
@@ -353,9 +418,10 @@ def manage_staff_view(request, staff_id):
         
         try:
             updated_staff = serializer.save()
+            forget_user_data(updated_staff.pk)
             return Response({
                 'message': 'Staff member updated successfully',
-                'staff': StaffSerializer(updated_staff).data
+                'staff': serializer.data
             }, status=status.HTTP_200_OK)
         except Exception as e:
             return Response(
@@ -365,10 +431,11 @@ def manage_staff_view(request, staff_id):
     
     elif request.method == 'DELETE':
         try:
-            # Delete the associated user
-            user = staff.user
-            staff.delete()
-            user.delete()
+            # Deleting the user cascades to the profile; one transaction so
+            # a failure can't leave either row behind
+            with transaction.atomic():
+                staff.user.delete()
+            forget_user_data(staff.pk)
             return Response(
                 {'message': 'Staff member deleted successfully'},
                 status=status.HTTP_204_NO_CONTENT
@@ -383,23 +450,17 @@ def manage_staff_view(request, staff_id):
 class HeadOfDepartmentListCreateView(generics.ListCreateAPIView):
     """
     List all HODs or create a new HOD appointment (Admin only)
-    GET /api/auth/hods/
+    GET /api/auth/hods/  (?ordering=duration or -duration sorts by tenure)
     POST /api/auth/hods/
     """
-    permission_classes = [IsAuthenticated, IsAdminUser]
+    permission_classes = [IsAdmin]
     serializer_class = HeadOfDepartmentSerializer
-    # Initialize HOD view
     
-    # In users/views.py, update the get_queryset method:
-
     def get_queryset(self):
         """Return all HODs with related staff and user data"""
-        queryset = HeadOfDepartment.objects.select_related(
-            'staff', 
-            'staff__user'
-        ).all()
-    
-    # Existing filtering code...
+        queryset = HeadOfDepartment.objects.for_list()
+        
+        # Optional filters
         department = self.request.query_params.get('department')
         if department:
             queryset = queryset.filter(department=department)
@@ -409,12 +470,18 @@ class HeadOfDepartmentListCreateView(generics.ListCreateAPIView):
             is_active = is_active.lower() == 'true'
             queryset = queryset.filter(is_active=is_active)
         
-        return queryset.order_by('department', '-is_active', '-start_date')   
+        # Tenure is the interval annotated by with_duration(), sorted in SQL
+        ordering = self.request.query_params.get('ordering')
+        if ordering in ('duration', '-duration'):
+            return queryset.order_by(ordering.replace('duration', 'tenure'), 'department')
+        
+        return queryset.order_by('department', '-is_active', '-start_date')
+    
     def perform_create(self, serializer):
         """Create a new HOD appointment"""
         # Set start date to current date if not provided
         if 'start_date' not in serializer.validated_data:
-            serializer.validated_data['start_date'] = timezone.now().date()
+            serializer.validated_data['start_date'] = timezone.localdate()
         serializer.save()
 
 
@@ -426,7 +493,7 @@ class HeadOfDepartmentDetailView(generics.RetrieveUpdateDestroyAPIView):
     PATCH /api/auth/hods/<id>/
     DELETE /api/auth/hods/<id>/
     """
-    permission_classes = [IsAuthenticated, IsAdminUser]
+    permission_classes = [IsAdmin]
     serializer_class = HeadOfDepartmentSerializer
     queryset = HeadOfDepartment.objects.all()
     lookup_field = 'id'
@@ -435,15 +502,15 @@ class HeadOfDepartmentDetailView(generics.RetrieveUpdateDestroyAPIView):
         """Update a HOD appointment"""
         # If making the HOD inactive, set end date to current date
         if 'is_active' in serializer.validated_data and not serializer.validated_data['is_active']:
-            serializer.validated_data['end_date'] = timezone.now().date()
+            serializer.validated_data['end_date'] = timezone.localdate()
         serializer.save()
     
     def perform_destroy(self, instance):
         """Delete a HOD appointment"""
-        # Instead of deleting, set as inactive and set end date
-        instance.is_active = False
-        instance.end_date = timezone.now().date()
-        instance.save()
+        # Instead of deleting, set as inactive and set end date in one narrow UPDATE
+        HeadOfDepartment.objects.filter(pk=instance.pk).update(
+            is_active=False, end_date=timezone.localdate()
+        )
 
 
 class DepartmentHODView(APIView):
@@ -456,12 +523,13 @@ class DepartmentHODView(APIView):
     def get(self, request, department):
         """Get the current HOD for the specified department"""
         try:
-            hod = HeadOfDepartment.objects.get(
+            # Read-only, so the trimmed list projection is enough
+            hod = HeadOfDepartment.objects.for_list().get(
                 department=department,
                 is_active=True
             )
             serializer = HeadOfDepartmentSerializer(hod)
-            return Response(serializer.data)
+            return conditional_response(request, serializer.data)
         except HeadOfDepartment.DoesNotExist:
             return Response(
                 {'detail': f'No active HOD found for {department} department'},